@@ -14,6 +14,8 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.gridspec as gridspec
 
+_DEPTH_SET = frozenset(("DEPT", "DEPTH"))
+
 
 class PlotWidget(QWidget):
     def __init__(self, parent=None):
@@ -24,6 +26,8 @@ class PlotWidget(QWidget):
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         self.setLayout(layout)
+        self._gs = None
+        self._gs_key = None
 
     def update_plots(self, las_list):
         """ Updates the plots dynamically based on LAS file selection """
@@ -33,14 +37,23 @@ class PlotWidget(QWidget):
             self.canvas.draw()
             return
 
-        gs = gridspec.GridSpec(N, 1, figure=self.figure)
+        if N != self._gs_key:
+            self._gs = gridspec.GridSpec(N, 1, figure=self.figure)
+            self._gs_key = N
+        gs = self._gs
 
         for i, las in enumerate(las_list):
             curves = las.curves
-            depth_curve = next((curve for curve in curves if curve.mnemonic.upper() in ["DEPT", "DEPTH"]), None)
-            depth = depth_curve.data if depth_curve else np.arange(len(curves[0].data))
-            
-            plot_curves = [curve for curve in curves if curve.mnemonic.upper() not in ["DEPT", "DEPTH"]]
+            depth = None
+            plot_curves = []
+            for curve in curves:
+                if curve.mnemonic.upper() not in _DEPTH_SET:
+                    plot_curves.append(curve)
+                elif depth is None:
+                    depth = curve.data
+            if depth is None:
+                depth = np.arange(len(curves[0].data))
+
             ax = self.figure.add_subplot(gs[i, 0])
             
             for curve in plot_curves:
@@ -1,11 +1,21 @@
 import sys
 import os
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from PyQt5 import uic
-import lasio
+try:
+    import lasio_rs as lasio
+except ImportError:
+    import lasio
 import numpy as np
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QPointF, QRectF, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QPolygonF
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, QPushButton,
+    QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, QGridLayout, QPushButton,
     QFileDialog, QListWidget, QLabel, QMessageBox, QScrollArea, QSpinBox, QCheckBox, QMenuBar
 )
 import matplotlib
@@ -13,6 +23,47 @@ matplotlib.use("Qt5Agg")
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.gridspec as gridspec
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_DEPTH_SET = frozenset(("DEPT", "DEPTH"))
+
+# "auto" uses pyqtgraph when installed and matplotlib otherwise; "matplotlib" forces PlotWidget;
+# "qpainter" opts in to the lightweight TrackGridWidget (no axis labels, titles or ticks)
+PLOT_BACKEND = "auto"
+
+
+@dataclass
+class WellCache:
+    well_name: str
+    depth: np.ndarray
+    data: np.ndarray
+    mnemonics: tuple
+    descrs: tuple
+
+
+def decimate_minmax(column, depth, target):
+    n_bins = target // 2
+    if n_bins < 1 or depth.size <= target:
+        return column, depth
+
+    bucket = depth.size // n_bins
+    n = n_bins * bucket
+    blocks = column[:n].reshape(n_bins, bucket)
+    nan_blocks = np.isnan(blocks)
+    lo = np.where(nan_blocks, np.inf, blocks).argmin(axis=1)
+    hi = np.where(nan_blocks, -np.inf, blocks).argmax(axis=1)
+
+    offsets = np.arange(n_bins) * bucket
+    idx = np.sort(np.stack([lo + offsets, hi + offsets], axis=1), axis=1).ravel()
+    idx = np.concatenate([idx, np.arange(n, depth.size)])
+    return column[idx], depth[idx]
 
 
 class PlotWidget(QWidget):
@@ -25,43 +76,565 @@ class PlotWidget(QWidget):
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
-    def update_plots(self, las_list, track_count=None, use_track_count=False):
-        self.figure.clf()
-        N = len(las_list)
+        self._axes = {}
+        self._lines = {}
+        self._max_cols = None
+        self._layout_key = None
+        self._backgrounds = {}
+        self._wells = []
+        self._decimated = {}
+        self._gs = None
+        self._gs_key = None
+        self.canvas.mpl_connect('draw_event', self._cache_bg)
+
+    def update_plots(self, wells, track_count=None, use_track_count=False):
+        self._wells = wells
+        N = len(wells)
         if N == 0:
+            self._clear_axes()
+            self.canvas.draw_idle()
             return
 
-        n_curves_list = []
-        for las in las_list:
-            curves = [curve for curve in las.curves if curve.mnemonic.upper() not in ["DEPT", "DEPTH"]]
-            n_curves_list.append(len(curves))
-
+        n_curves_list = [cache.data.shape[1] for _, cache in wells]
         max_cols = max(n_curves_list) if not use_track_count else track_count
-        gs = gridspec.GridSpec(N, max_cols, figure=self.figure)
+        layout_key = (tuple(well_name for well_name, _ in wells), max_cols)
+        if layout_key == self._layout_key and self._backgrounds:
+            self._blit_lines(wells)
+            return
+        self._layout_key = layout_key
+
+        if max_cols != self._max_cols:
+            self._clear_axes()
+            self._max_cols = max_cols
+        if (N, max_cols) != self._gs_key:
+            self._gs = gridspec.GridSpec(N, max_cols, figure=self.figure)
+            self._gs_key = (N, max_cols)
+        gs = self._gs
+
+        selected = {well_name for well_name, _ in wells}
+        for well_name in list(self._axes):
+            if well_name not in selected:
+                for ax in self._axes.pop(well_name):
+                    ax.remove()
+                self._lines = {key: line for key, line in self._lines.items() if key[0] != well_name}
+                self._decimated = {key: dec for key, dec in self._decimated.items() if key[0] != well_name}
+
+        for i, (well_name, cache) in enumerate(wells):
+            axes = self._axes.get(well_name)
+            if axes is None:
+                self._axes[well_name] = self._add_well_axes(gs, i, max_cols, well_name, cache)
+                continue
+            for j, ax in enumerate(axes):
+                ax.set_subplotspec(gs[i, j])
+                if j < cache.data.shape[1]:
+                    mnemonic = cache.mnemonics[j]
+                    self._lines[(well_name, mnemonic)].set_data(*self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth))
+
+        self.canvas.draw_idle()
+
+    def _blit_lines(self, wells):
+        for well_name, cache in wells:
+            for j, ax in enumerate(self._axes[well_name]):
+                bg = self._backgrounds.get(ax)
+                if bg is None or j >= cache.data.shape[1]:
+                    continue
+                mnemonic = cache.mnemonics[j]
+                line = self._lines[(well_name, mnemonic)]
+                line.set_data(*self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth))
+                self.canvas.restore_region(bg)
+                ax.draw_artist(line)
+                self.canvas.blit(ax.bbox)
+
+    def _line_data(self, well_name, mnemonic, column, depth):
+        target = 2 * self.canvas.height()
+        cached = self._decimated.get((well_name, mnemonic))
+        if cached is None or cached[0] != target:
+            cached = (target,) + decimate_minmax(column, depth, target)
+            self._decimated[(well_name, mnemonic)] = cached
+        return cached[1], cached[2]
+
+    def resizeEvent(self, event):
+        super(PlotWidget, self).resizeEvent(event)
+        self._decimated.clear()
+        for well_name, cache in self._wells:
+            for j, mnemonic in enumerate(cache.mnemonics[:self._max_cols]):
+                line = self._lines.get((well_name, mnemonic))
+                if line is not None:
+                    line.set_data(*self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth))
+
+    def _cache_bg(self, event):
+        # The lines are animated, so a full draw leaves them out: grab that as the
+        # blit background, then paint the lines on top into the same buffer.
+        self._backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self.figure.axes}
+        for line in self._lines.values():
+            line.axes.draw_artist(line)
+
+    def _add_well_axes(self, gs, i, max_cols, well_name, cache):
+        axes = []
+        n_curves = cache.data.shape[1]
+        for j in range(max_cols):
+            # Every track of a well plots against the same depth, so the row shares one y-axis
+            ax = self.figure.add_subplot(gs[i, j], sharey=axes[0] if j else None)
+            if j < n_curves:
+                mnemonic = cache.mnemonics[j]
+                line, = ax.plot(*self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth),
+                                animated=True)
+                self._lines[(well_name, mnemonic)] = line
+                ax.set_xlabel(mnemonic)
+                ax.set_title(cache.descrs[j] if cache.descrs[j] else mnemonic)
+            else:
+                ax.axis('off')
+            if j == 0:
+                ax.invert_yaxis()
+                ax.set_ylabel(f"Depth\nWell: {well_name}")
+            else:
+                ax.tick_params(labelleft=False)
+            axes.append(ax)
+        return axes
+
+    def _clear_axes(self):
+        self.figure.clf()
+        self._axes = {}
+        self._lines = {}
+        self._max_cols = None
+        self._layout_key = None
+        self._backgrounds = {}
+
+
+class LogPlotWidget(QWidget):
+    def __init__(self, parent=None):
+        super(LogPlotWidget, self).__init__(parent)
+        self.setMinimumSize(300, 200)
+        self.glw = pg.GraphicsLayoutWidget()
+        layout = QVBoxLayout()
+        layout.addWidget(self.glw)
+        self.setLayout(layout)
+
+        self._plots = {}
+        self._slot_items = {}
+        self._items = {}
+        self._layout_key = None
+        self._wells = []
+        self._decimated = {}
+
+    def update_plots(self, wells, track_count=None, use_track_count=False):
+        self._wells = wells
+        N = len(wells)
+        if N == 0:
+            max_cols = 0
+        else:
+            n_curves_list = [cache.data.shape[1] for _, cache in wells]
+            max_cols = max(n_curves_list) if not use_track_count else track_count
+        layout_key = (tuple(well_name for well_name, _ in wells), max_cols)
+        if layout_key == self._layout_key:
+            for well_name, cache in wells:
+                for j, mnemonic in enumerate(cache.mnemonics[:max_cols]):
+                    self._items[(well_name, mnemonic)].setData(*self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth))
+            return
+        self._layout_key = layout_key
 
-        for i, las in enumerate(las_list):
-            curves = las.curves
-            depth_curve = next((curve for curve in curves if curve.mnemonic.upper() in ["DEPT", "DEPTH"]), None)
-            depth = depth_curve.data if depth_curve else np.arange(len(curves[0].data))
+        # Keep the PlotItem grid alive and only add/remove the cells that changed
+        for key in list(self._plots):
+            if key[0] >= N or key[1] >= max_cols:
+                self.glw.removeItem(self._plots.pop(key))
+                self._slot_items.pop(key, None)
 
-            plot_curves = [curve for curve in curves if curve.mnemonic.upper() not in ["DEPT", "DEPTH"]]
-            n_curves = len(plot_curves)
+        selected = {well_name for well_name, _ in wells}
+        self._decimated = {key: dec for key, dec in self._decimated.items() if key[0] in selected}
+        self._items = {}
+        for i, (well_name, cache) in enumerate(wells):
+            n_curves = cache.data.shape[1]
 
             for j in range(max_cols):
-                ax = self.figure.add_subplot(gs[i, j])
+                plot = self._plots.get((i, j))
+                if plot is None:
+                    plot = self.glw.addPlot(row=i, col=j)
+                    plot.invertY(True)
+                    self._plots[(i, j)] = plot
+                item = self._slot_items.get((i, j))
                 if j < n_curves:
-                    curve = plot_curves[j]
-                    ax.plot(curve.data, depth)
-                    ax.set_xlabel(curve.mnemonic)
-                    ax.set_title(curve.descr if curve.descr else curve.mnemonic)
-                    ax.invert_yaxis()
+                    mnemonic = cache.mnemonics[j]
+                    x, y = self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth)
+                    if item is None:
+                        item = plot.plot(x, y, connect='finite')
+                        self._slot_items[(i, j)] = item
+                    else:
+                        item.setData(x, y)
+                    self._items[(well_name, mnemonic)] = item
+                    plot.showAxis('left')
+                    plot.showAxis('bottom')
+                    plot.setLabel('bottom', mnemonic)
+                    plot.setTitle(cache.descrs[j] if cache.descrs[j] else mnemonic)
+                    plot.enableAutoRange()
                 else:
-                    ax.axis('off')
+                    if item is not None:
+                        item.setData([], [])
+                    plot.hideAxis('left')
+                    plot.hideAxis('bottom')
+                    plot.setTitle(None)
                 if j == 0:
-                    well_name = las.well.WELL.value if las.well.WELL.value else "Unknown"
-                    ax.set_ylabel(f"Depth\nWell: {well_name}")
+                    plot.setLabel('left', f"Depth - Well: {well_name}")
+
+    def _line_data(self, well_name, mnemonic, column, depth):
+        target = 2 * self.glw.height()
+        cached = self._decimated.get((well_name, mnemonic))
+        if cached is None or cached[0] != target:
+            cached = (target,) + decimate_minmax(column, depth, target)
+            self._decimated[(well_name, mnemonic)] = cached
+        return cached[1], cached[2]
+
+    def resizeEvent(self, event):
+        super(LogPlotWidget, self).resizeEvent(event)
+        self._decimated.clear()
+        for well_name, cache in self._wells:
+            for j, mnemonic in enumerate(cache.mnemonics):
+                item = self._items.get((well_name, mnemonic))
+                if item is not None:
+                    item.setData(*self._line_data(well_name, mnemonic, cache.data[:, j], cache.depth))
+
+
+class LogTrack(QWidget):
+    def __init__(self, parent=None):
+        super(LogTrack, self).__init__(parent)
+        self.setMinimumSize(80, 120)
+        self._curve = None
+        self._depth = None
+        self._title = ""
+        self._ruler = False
+        self._depth_range = None
+        self._polylines = None
+
+    def set_data(self, curve, depth, title="", ruler=False):
+        self._curve = curve
+        self._depth = depth
+        self._title = title
+        self._ruler = ruler
+        self._depth_range = None
+        if depth is not None:
+            finite_depth = depth[np.isfinite(depth)]
+            if finite_depth.size:
+                self._depth_range = (float(finite_depth.min()), float(finite_depth.max()))
+        self._polylines = None
+        self.update()
 
-        self.canvas.draw()
+    def resizeEvent(self, event):
+        super(LogTrack, self).resizeEvent(event)
+        self._polylines = None
+
+    def _plot_rect(self):
+        left = 48 if self._ruler else 4
+        return QRectF(self.rect()).adjusted(left, 18, -4, -4)
+
+    def _build_polylines(self, rect):
+        curve, depth = decimate_minmax(self._curve, self._depth, 2 * int(rect.height()))
+        finite = np.isfinite(curve) & np.isfinite(depth)
+        if not finite.any():
+            return []
+        x_lo, x_hi = float(curve[finite].min()), float(curve[finite].max())
+        y_lo, y_hi = self._depth_range
+        xs = rect.left() + (curve - x_lo) * (rect.width() / max(x_hi - x_lo, 1e-12))
+        ys = rect.top() + (depth - y_lo) * (rect.height() / max(y_hi - y_lo, 1e-12))
+
+        # Split at NULL gaps and fill each QPolygonF's point buffer in place
+        points = np.column_stack([xs, ys]).astype(np.float64)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.view(np.int8), [0]))))
+        polylines = []
+        for start, stop in zip(edges[::2], edges[1::2]):
+            size = int(stop - start)
+            polyline = QPolygonF()
+            polyline.fill(QPointF(), size)
+            buf = polyline.data()
+            buf.setsize(2 * size * 8)
+            np.frombuffer(buf, dtype=np.float64).reshape(-1, 2)[:] = points[start:stop]
+            polylines.append(polyline)
+        return polylines
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        rect = self._plot_rect()
+        painter.setPen(Qt.black)
+        painter.drawText(QRectF(0, 0, self.width(), 16), Qt.AlignCenter, self._title)
+        if self._curve is None or self._depth_range is None:
+            return
+        painter.drawRect(rect)
+
+        if self._ruler:
+            depth_lo, depth_hi = self._depth_range
+            painter.drawText(QRectF(0, rect.top(), rect.left() - 2, 14), Qt.AlignRight, f"{depth_lo:g}")
+            painter.drawText(QRectF(0, rect.bottom() - 14, rect.left() - 2, 14), Qt.AlignRight, f"{depth_hi:g}")
+
+        if self._polylines is None:
+            self._polylines = self._build_polylines(rect)
+        painter.setPen(QPen(Qt.blue, 1))
+        painter.setClipRect(rect)
+        for polyline in self._polylines:
+            painter.drawPolyline(polyline)
+
+
+class TrackGridWidget(QWidget):
+    def __init__(self, parent=None):
+        super(TrackGridWidget, self).__init__(parent)
+        self.setMinimumSize(300, 200)
+        self.grid = QGridLayout()
+        self.grid.setSpacing(2)
+        self.setLayout(self.grid)
+        self._tracks = {}
+
+    def update_plots(self, wells, track_count=None, use_track_count=False):
+        N = len(wells)
+        if N == 0:
+            max_cols = 0
+        else:
+            n_curves_list = [cache.data.shape[1] for _, cache in wells]
+            max_cols = max(n_curves_list) if not use_track_count else track_count
+
+        for key in list(self._tracks):
+            if key[0] >= N or key[1] >= max_cols:
+                track = self._tracks.pop(key)
+                self.grid.removeWidget(track)
+                track.deleteLater()
+
+        for i, (well_name, cache) in enumerate(wells):
+            n_curves = cache.data.shape[1]
+            for j in range(max_cols):
+                track = self._tracks.get((i, j))
+                if track is None:
+                    track = LogTrack(self)
+                    self.grid.addWidget(track, i, j)
+                    self._tracks[(i, j)] = track
+                if j < n_curves:
+                    mnemonic = cache.mnemonics[j]
+                    title = f"{well_name}: {mnemonic}" if j == 0 else mnemonic
+                    track.set_data(cache.data[:, j], cache.depth, title, ruler=j == 0)
+                else:
+                    track.set_data(None, None, well_name if j == 0 else "")
+
+
+def build_curve_cache(las, file_path):
+    curves = las.curves
+    upper_mnemonics = [curve.mnemonic.upper() for curve in curves]
+    depth_idx = next((i for i, m in enumerate(upper_mnemonics) if m in _DEPTH_SET), None)
+    depth = curves[depth_idx].data if depth_idx is not None else np.arange(len(curves[0].data))
+
+    plot_curves = [curve for curve, m in zip(curves, upper_mnemonics) if m not in _DEPTH_SET]
+    if plot_curves:
+        data = np.column_stack([curve.data for curve in plot_curves])
+    else:
+        data = np.empty((len(depth), 0))
+
+    try:
+        null_val = float(las.well.NULL.value)
+    except (AttributeError, TypeError, ValueError):
+        null_val = None
+    if null_val is not None:
+        data = np.where(data == null_val, np.nan, data)
+
+    depth = depth.astype(np.float32, copy=False)
+    data = data.astype(np.float32, copy=False)
+    mnemonics = tuple(curve.mnemonic for curve in plot_curves)
+    descrs = tuple(curve.descr for curve in plot_curves)
+    well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(file_path)
+    return WellCache(well_name, depth, data, mnemonics, descrs)
+
+
+def _parse_las_numeric(buf, out):
+    # Whitespace-delimited float tokenizer for the ~A section; returns -1 on a non-numeric token
+    n = buf.size
+    count = 0
+    i = 0
+    while i < n:
+        c = buf[i]
+        if c == 32 or c == 9 or c == 10 or c == 13:
+            i += 1
+            continue
+        if count >= out.size:
+            return -1
+
+        sign = 1.0
+        if c == 45:
+            sign = -1.0
+            i += 1
+        elif c == 43:
+            i += 1
+        mant = 0.0
+        exp = 0
+        digits = 0
+        while i < n and 48 <= buf[i] <= 57:
+            mant = mant * 10.0 + (buf[i] - 48)
+            digits += 1
+            i += 1
+        if i < n and buf[i] == 46:
+            i += 1
+            while i < n and 48 <= buf[i] <= 57:
+                mant = mant * 10.0 + (buf[i] - 48)
+                exp -= 1
+                digits += 1
+                i += 1
+        if digits == 0:
+            return -1
+        if i < n and (buf[i] == 101 or buf[i] == 69):
+            i += 1
+            exp_sign = 1
+            if i < n and buf[i] == 45:
+                exp_sign = -1
+                i += 1
+            elif i < n and buf[i] == 43:
+                i += 1
+            e = 0
+            while i < n and 48 <= buf[i] <= 57:
+                e = e * 10 + (buf[i] - 48)
+                i += 1
+            exp += exp_sign * e
+        if i < n and not (buf[i] == 32 or buf[i] == 9 or buf[i] == 10 or buf[i] == 13):
+            return -1
+
+        # With at most 15 digits and |exp| <= 22 both mant and 10**|exp| are exact doubles,
+        # so one multiply or divide is correctly rounded (mant * 10.0 ** -k is not, and
+        # would miss exact NULL matches). Anything else goes back to lasio.
+        if digits > 15 or exp > 22 or exp < -22:
+            return -1
+        if exp < 0:
+            out[count] = sign * (mant / 10.0 ** -exp)
+        else:
+            out[count] = sign * (mant * 10.0 ** exp)
+        count += 1
+    return count
+
+
+if njit is not None:
+    _parse_las_numeric = njit(cache=True)(_parse_las_numeric)
+
+
+def _read_las(path):
+    # The JIT decoder only pays off against pure-Python lasio, and needs numba
+    if njit is None or lasio.__name__ != "lasio":
+        return lasio.read(path)
+
+    las = lasio.read(path, ignore_data=True)
+    with open(path, "rb") as f:
+        raw = f.read()
+    start = raw.find(b"\n~A")
+    n_cols = len(las.curves)
+    if start < 0 or n_cols == 0:
+        return lasio.read(path)
+
+    data_start = raw.find(b"\n", start + 1)
+    if data_start < 0:
+        return lasio.read(path)  # ~A is the last line: no data section to decode
+    body = np.frombuffer(raw, dtype=np.uint8)[data_start + 1:]
+    values = np.empty(body.size // 2 + 1, dtype=np.float64)
+    count = _parse_las_numeric(body, values)
+    if count <= 0 or count % n_cols:
+        return lasio.read(path)
+
+    values = values[:count].reshape(-1, n_cols)
+    for i, curve in enumerate(las.curves):
+        curve.data = values[:, i]
+    return las
+
+
+# Parsed wells persist here across launches, keyed on (format version, abspath, mtime, size)
+# of the LAS file. Each viewer has its own directory since their entry layouts differ; bump
+# CACHE_VERSION whenever build_curve_cache changes dtypes or NULL handling.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".febproject_cache", "febprojectno01")
+CACHE_VERSION = 2
+# Entries not read for this long are pruned on the next write, so files that were moved
+# or deleted do not leave their entries behind forever
+CACHE_MAX_AGE = 30 * 24 * 3600
+_CACHE_SUFFIXES = ("_depth.npy", "_data.npy", ".json")
+
+
+def _disk_cache_base(path, mtime):
+    key = f"v{CACHE_VERSION}|{path}|{mtime}|{os.path.getsize(path)}"
+    # Prefixed with a hash of the path alone, so older entries of the same file can be found
+    source = hashlib.sha1(path.encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{source}_{hashlib.sha1(key.encode()).hexdigest()}")
+
+
+def _prune_disk_cache(base):
+    # Drop superseded entries of the same file (edited since) and any entry unused for
+    # CACHE_MAX_AGE; everything but the entry at base is fair game
+    name = os.path.basename(base)
+    source = name.split("_", 1)[0] + "_"
+    cutoff = time.time() - CACHE_MAX_AGE
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(name):
+                    continue
+                try:
+                    if entry.name.startswith(source) or entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass  # Already removed by another worker
+    except OSError:
+        pass
+
+
+def _load_disk_cache(base):
+    try:
+        # The JSON sidecar is written last, so its presence marks a complete entry
+        with open(base + ".json") as f:
+            meta = json.load(f)
+        depth = np.load(base + "_depth.npy", mmap_mode="r")
+        data = np.load(base + "_data.npy", mmap_mode="r")
+        cache = WellCache(meta["well_name"], depth, data, tuple(meta["mnemonics"]), tuple(meta["descrs"]))
+        for suffix in _CACHE_SUFFIXES:
+            os.utime(base + suffix)  # Mark the entry as used for _prune_disk_cache
+        return cache
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # Missing, partial or foreign entry: re-parse and overwrite it
+
+
+def _save_disk_cache(base, cache):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.save(base + "_depth.npy", cache.depth)
+        np.save(base + "_data.npy", cache.data)
+        with open(base + ".json", "w") as f:
+            json.dump({"well_name": cache.well_name, "mnemonics": list(cache.mnemonics),
+                       "descrs": list(cache.descrs)}, f)
+    except OSError:
+        return  # Only an accelerator; an unwritable home just means re-parsing next launch
+    _prune_disk_cache(base)
+
+
+@lru_cache(maxsize=64)
+def _cached_read(path, mtime):
+    base = _disk_cache_base(path, mtime)
+    cache = _load_disk_cache(base)
+    if cache is None:
+        las = _read_las(path)
+        cache = build_curve_cache(las, path)
+        _save_disk_cache(base, cache)
+    return cache
+
+
+def _parse_one(file_path):
+    path = os.path.abspath(file_path)
+    return _cached_read(path, os.path.getmtime(path))
+
+
+class WorkerSignals(QObject):
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+
+class LasLoader(QRunnable):
+    def __init__(self, file_path):
+        super(LasLoader, self).__init__()
+        self.file_path = file_path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            path = os.path.abspath(self.file_path)
+            cache = _cached_read(path, os.path.getmtime(path))
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        self.signals.loaded.emit(self.file_path, cache)
 
 
 class ControlDockWidget(QDockWidget):
@@ -69,7 +642,20 @@ class ControlDockWidget(QDockWidget):
         super(ControlDockWidget, self).__init__("Control Panel", parent)
         self.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         self.las_files = {}
+        self._selected_names = []
+        self._selected_set = set()
+        self._pending_loads = 0
+        self._new_names = []
+        self._process_pool = None
+        self._pool_signals = WorkerSignals()
+        self._pool_signals.loaded.connect(self.on_las_loaded)
+        self._pool_signals.failed.connect(self.on_las_failed)
         self.main_window = parent
+
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(80)
+        self._redraw_timer.timeout.connect(self._do_update_plot)
         
         widget = QWidget()
         layout = QVBoxLayout()
@@ -111,38 +697,77 @@ class ControlDockWidget(QDockWidget):
 
     def load_las_file(self):
         file_paths, _ = QFileDialog.getOpenFileNames(self, "Open LAS File(s)", "", "LAS Files (*.las)")
-        if file_paths:
+        self._pending_loads += len(file_paths)
+        if lasio.__name__ == "lasio" and len(file_paths) > 1:
+            # Pure-Python lasio holds the GIL while parsing, so batches go to worker processes
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
             for file_path in file_paths:
-                try:
-                    las = lasio.read(file_path)
-                    well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(file_path)
-                    if well_name not in self.las_files:
-                        self.las_files[well_name] = las
-                        self.loaded_list.addItem(well_name)
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to load LAS file: {str(e)}")
+                future = self._process_pool.submit(_parse_one, file_path)
+                future.add_done_callback(partial(self._on_future_done, file_path))
+            return
+        for file_path in file_paths:
+            loader = LasLoader(file_path)
+            loader.signals.loaded.connect(self.on_las_loaded)
+            loader.signals.failed.connect(self.on_las_failed)
+            QThreadPool.globalInstance().start(loader)
+
+    def _on_future_done(self, file_path, future):
+        try:
+            cache = future.result()
+        except Exception as e:
+            self._pool_signals.failed.emit(file_path, str(e))
+            return
+        self._pool_signals.loaded.emit(file_path, cache)
+
+    def on_las_loaded(self, file_path, cache):
+        well_name = cache.well_name
+        if well_name not in self.las_files:
+            self.las_files[well_name] = cache
+            self._new_names.append(well_name)
+        self._finish_load()
+
+    def on_las_failed(self, file_path, error):
+        QMessageBox.critical(self, "Error", f"Failed to load LAS file: {error}")
+        self._finish_load()
+
+    def _finish_load(self):
+        self._pending_loads -= 1
+        if self._pending_loads == 0 and self._new_names:
+            self.loaded_list.setUpdatesEnabled(False)
+            self.loaded_list.addItems(self._new_names)
+            self.loaded_list.setUpdatesEnabled(True)
+            self._new_names = []
 
     def select_well_on_click(self, item):
         well_name = item.text()
-        if well_name not in [self.selected_list.item(i).text() for i in range(self.selected_list.count())]:
+        if well_name not in self._selected_set:
+            self._selected_set.add(well_name)
+            self._selected_names.append(well_name)
             self.selected_list.addItem(well_name)
         self.update_plot()
 
     def remove_selected_well_on_click(self, item):
         row = self.selected_list.row(item)
         self.selected_list.takeItem(row)
+        well_name = self._selected_names.pop(row)
+        self._selected_set.discard(well_name)
         self.update_plot()
 
     def clear_selected_wells(self):
         self.selected_list.clear()
+        self._selected_names = []
+        self._selected_set.clear()
         self.update_plot()    
 
     def update_plot(self):
-        selected_wells = [self.selected_list.item(i).text() for i in range(self.selected_list.count())]
-        las_list = [self.las_files[well] for well in selected_wells]
+        self._redraw_timer.start()
+
+    def _do_update_plot(self):
+        wells = [(well, self.las_files[well]) for well in self._selected_names]
         use_track_count = self.track_checkbox.isChecked()
         track_count = self.track_spinbox.value() if use_track_count else None
-        self.main_window.plot_widget.update_plots(las_list, track_count=track_count, use_track_count=use_track_count)
+        self.main_window.plot_widget.update_plots(wells, track_count=track_count, use_track_count=use_track_count)
         
 
 
@@ -153,7 +778,12 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Well Data Visualization")
         self.setGeometry(100, 100, 1000, 600)
 
-        self.plot_widget = PlotWidget(self)
+        if PLOT_BACKEND == "qpainter":
+            self.plot_widget = TrackGridWidget(self)
+        elif PLOT_BACKEND == "auto" and pg is not None:
+            self.plot_widget = LogPlotWidget(self)
+        else:
+            self.plot_widget = PlotWidget(self)
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setWidget(self.plot_widget)
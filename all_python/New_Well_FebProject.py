@@ -1,5 +1,10 @@
 import sys
 import os
+import hashlib
+import json
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import lasio
 import numpy as np
 import pandas as pd
@@ -8,28 +13,230 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (QMainWindow, QFileDialog, QDockWidget, QListWidget,
                              QListWidgetItem, QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
                              QComboBox, QPushButton, QCheckBox, QSpinBox, QScrollArea, QAction, QStackedWidget,
-                             QMenu, QDialog, QFormLayout, QDialogButtonBox, QColorDialog)
+                             QMenu, QDialog, QFormLayout, QDialogButtonBox, QColorDialog, QProgressDialog,
+                             QListView, QAbstractItemView, QStyledItemDelegate)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 from PyQt5.QtGui import QIcon
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# ----------------------------------------------------------------------
+# Min/max decimation: reduce a curve to 2*n_bins points keeping each bin's extremes.
+# ----------------------------------------------------------------------
+def _decimate(y, depth, n_bins):
+    n = len(y)
+    if n_bins <= 0 or n <= 2 * n_bins:
+        return y, depth
+    bucket = n // n_bins
+    m = bucket * n_bins
+    d_bins = depth[:m].reshape(n_bins, bucket)
+    out_y = np.empty(2 * n_bins, dtype=y.dtype)
+    out_d = np.empty(2 * n_bins, dtype=depth.dtype)
+    if njit is not None:
+        # asarray drops the memmap subclass (no copy) so numba sees a plain array.
+        _minmax_bins(np.asarray(y), bucket, out_y)
+    else:
+        y_bins = y[:m].reshape(n_bins, bucket)
+        out_y[0::2] = y_bins.min(axis=1)
+        out_y[1::2] = y_bins.max(axis=1)
+    out_d[0::2] = d_bins[:, 0]
+    out_d[1::2] = d_bins[:, -1]
+    return np.concatenate([out_y, y[m:]]), np.concatenate([out_d, depth[m:]])
+
+if njit is not None:
+    # Fused min/max per bucket: one pass over the curve, no reshaped temporaries.
+    # Curves are NaN-free after load, so fastmath is safe here.
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _minmax_bins(y, bucket, out):
+        for i in prange(out.shape[0] // 2):
+            start = i * bucket
+            lo = y[start]
+            hi = lo
+            for j in range(start + 1, start + bucket):
+                v = y[j]
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+            out[2 * i] = lo
+            out[2 * i + 1] = hi
+
+# ----------------------------------------------------------------------
+# Fast LAS reader: lasio parses the header, pandas' C tokenizer parses the ~A section.
+# ----------------------------------------------------------------------
+def _read_las(path):
+    try:
+        with open(path, "r", errors="replace") as f:
+            ascii_line = next(i for i, line in enumerate(f) if line.lstrip().upper().startswith("~A"))
+        las = lasio.read(path, ignore_data=True)
+        # Wrapped rows span several lines; read_csv would pad each line with NaN
+        # instead of failing, so they have to be routed to lasio explicitly.
+        if "WRAP" in las.version and str(las.version.WRAP.value).strip().upper() == "YES":
+            raise ValueError("Wrapped LAS data section")
+        names = [curve.mnemonic for curve in las.curves]
+        null_val = las.well.NULL.value if "NULL" in las.well else -999.25
+        df = pd.read_csv(path, skiprows=ascii_line + 1, sep=r"\s+", header=None, names=names,
+                         dtype=np.float64, na_values=[null_val], comment="#", engine="c")
+        return las, df.to_numpy()
+    except Exception:
+        # Wrapped or otherwise irregular files go through lasio's own parser.
+        las = lasio.read(path)
+        return las, las.data
+
+# ----------------------------------------------------------------------
+# On-disk cache of parsed wells, keyed by format version + path + mtime + size. Curves
+# are reopened with mmap_mode='r', so only the rows that are actually plotted get paged
+# in. The maps are only valid in the process that opened them, so hits must be loaded
+# in the GUI process, never in a pool worker.
+# ----------------------------------------------------------------------
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".wellvision_cache")
+CACHE_VERSION = 1  # bump whenever the layout of the cached arrays changes
+
+def _cache_base(path):
+    st = os.stat(path)
+    key = f"v{CACHE_VERSION}|{os.path.abspath(path)}|{st.st_mtime}|{st.st_size}"
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest())
+
+def _load_cached(path):
+    base = _cache_base(path)
+    try:
+        # The JSON sidecar is written last, so its presence marks a complete entry.
+        with open(base + ".json") as f:
+            meta = json.load(f)
+        curves = np.load(base + ".npy", mmap_mode="r")
+        depth = np.load(base + "_depth.npy", mmap_mode="r")
+        # One row per curve, so each column is a contiguous view into the map.
+        cols = {name: curves[i] for i, name in enumerate(meta["curves"])}
+        cols["DEPT"] = depth
+        return meta["well_name"], cols, meta["names"], path
+    except (OSError, ValueError, KeyError, IndexError):
+        return None
+
+def _save_cached(path, well_name, cols, names):
+    base = _cache_base(path)
+    curves = [name for name in cols if name != "DEPT"]
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if curves:
+            stacked = np.stack([cols[name] for name in curves])
+        else:
+            stacked = np.empty((0, len(cols["DEPT"])), dtype=np.float32)
+        np.save(base + ".npy", stacked)
+        np.save(base + "_depth.npy", cols["DEPT"])
+        with open(base + ".json", "w") as f:
+            json.dump({"well_name": well_name, "names": names, "curves": curves}, f)
+    except OSError:
+        pass  # The cache is only an accelerator; a read-only home just means re-parsing next time.
+
+# ----------------------------------------------------------------------
+# Parse one LAS file into per-curve arrays. Module level so worker processes can pickle it.
+# Returns (well_name, cols, names, path, depth_range); raises if no rows survive.
+# ----------------------------------------------------------------------
+def _depth_range(cols):
+    depth = cols["DEPT"]
+    if depth.size == 0:
+        # e.g. a curve that is entirely NULL empties the all-curves row mask.
+        raise ValueError("No depth rows with values in every curve.")
+    return float(depth.min()), float(depth.max())
+
+def _parse_las_file(path):
+    las, arr = _read_las(path)
+    names = [curve.mnemonic for curve in las.curves]
+    depth_col = next((name for name in names if name.upper() in ["DEPT", "DEPTH", "MD"]), None)
+    if depth_col is None:
+        raise ValueError("No valid depth column found.")
+    names[names.index(depth_col)] = "DEPT"
+    # Keep only rows where every curve has a value, as dropna() did, without building a DataFrame.
+    mask = ~np.isnan(arr).any(axis=1)
+    # Curves only need screen precision, so store them as float32; depth stays float64.
+    cols = {name: np.ascontiguousarray(arr[mask, i], dtype=np.float64 if name == "DEPT" else np.float32)
+            for i, name in enumerate(names)}
+    well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
+    depth_range = _depth_range(cols)
+    _save_cached(path, well_name, cols, names)
+    return well_name, cols, names, path, depth_range
+
+# ----------------------------------------------------------------------
+# FolderLoader: parses a batch of LAS files in a process pool off the GUI thread.
+# Cache hits are mapped here, in the GUI process, so their memmaps stay lazy; only
+# misses go to the pool. Results are posted back one at a time so the window stays responsive.
+# ----------------------------------------------------------------------
+class FolderLoader(QtCore.QThread):
+    loaded = QtCore.pyqtSignal(object)  # (well_name, cols, names, path, depth_range)
+    failed = QtCore.pyqtSignal(str, str)  # path, error message
+
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+
+    def run(self):
+        misses = []
+        for path in self.paths:
+            try:
+                cached = _load_cached(path)
+                if cached is None:
+                    misses.append(path)
+                    continue
+                self.loaded.emit(cached + (_depth_range(cached[1]),))
+            except Exception as e:
+                self.failed.emit(path, str(e))
+        if not misses:
+            return
+        # Spawn, not fork: forking from this thread would copy Qt's locks mid-use into the workers.
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as ex:
+            futures = {ex.submit(_parse_las_file, path): path for path in misses}
+            for future in as_completed(futures):
+                try:
+                    self.loaded.emit(future.result())
+                except Exception as e:
+                    self.failed.emit(futures[future], str(e))
+
+# ----------------------------------------------------------------------
+# Throttler: trailing-edge rate limit for expensive slots (same idea as superqt's qthrottled).
+# The first call arms a single-shot timer; calls inside the window only mark work as pending.
+# ----------------------------------------------------------------------
+class Throttler(QtCore.QObject):
+    def __init__(self, func, interval=100, parent=None):
+        super().__init__(parent)
+        self._func = func
+        self._pending = False
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._flush)
+
+    def __call__(self, *args):
+        self._pending = True
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @QtCore.pyqtSlot()
+    def _flush(self):
+        if self._pending:
+            self._pending = False
+            self._func()
 
 # ----------------------------------------------------------------------
-# Custom Well List Widget: Toggles check state on click outside checkbox area.
+# Custom Well List Widget: a left click anywhere on a row toggles its check state.
+# The toggle lives in the item delegate, so the view's own mouse handling stays in C++.
 # ----------------------------------------------------------------------
+class CheckRowDelegate(QStyledItemDelegate):
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.flags() & Qt.ItemIsUserCheckable):
+            state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+            return model.setData(index, state, Qt.CheckStateRole)
+        return super().editorEvent(event, model, option, index)
+
 class WellListWidget(QListWidget):
-    def mousePressEvent(self, event):
-        item = self.itemAt(event.pos())
-        if item is not None:
-            rect = self.visualItemRect(item)
-            # Assume the checkbox is within the left 20 pixels.
-            if event.pos().x() > rect.left() + 20:
-                if item.checkState() == Qt.Checked:
-                    item.setCheckState(Qt.Unchecked)
-                else:
-                    item.setCheckState(Qt.Checked)
-                return
-        super().mousePressEvent(event)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setItemDelegate(CheckRowDelegate(self))
 
 # ----------------------------------------------------------------------
 # PrimaryCurveControl: Always visible control for the primary curve.
@@ -43,7 +250,7 @@ class PrimaryCurveControl(QWidget):
         self.initUI()
     
     def initUI(self):
-        layout = QHBoxLayout()
+        layout = QHBoxLayout(self)
         layout.addWidget(QLabel("Primary:"))
         self.curve_combo = QComboBox()
         self.curve_combo.addItems(["Select Primary Curve"] + self.curves)
@@ -68,7 +275,6 @@ class PrimaryCurveControl(QWidget):
         self.width_spin.setValue(1)
         self.width_spin.valueChanged.connect(self.changed)
         layout.addWidget(self.width_spin)
-        self.setLayout(layout)
     
     def get_settings(self):
         curve = self.curve_combo.currentText()
@@ -82,6 +288,34 @@ class PrimaryCurveControl(QWidget):
             "primary": True
         }
 
+# ----------------------------------------------------------------------
+# SecondaryCurveModel: list model over TrackControl's secondary curve settings.
+# The view reads the dicts directly, so there is no parallel widget-item state.
+# ----------------------------------------------------------------------
+class SecondaryCurveModel(QtCore.QAbstractListModel):
+    def __init__(self, settings, parent=None):
+        super().__init__(parent)
+        self._settings = settings
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._settings)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._settings[index.row()]["curve"]
+        return None
+
+    def append(self, settings):
+        row = len(self._settings)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._settings.append(settings)
+        self.endInsertRows()
+
+    def remove(self, row):
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._settings[row]
+        self.endRemoveRows()
+
 # ----------------------------------------------------------------------
 # TrackControl Class: Combines a primary curve control and secondary curves list.
 # ----------------------------------------------------------------------
@@ -95,10 +329,11 @@ class TrackControl(QWidget):
         self.curves = curves
         # List for secondary curves (each is a dict without color)
         self.secondary_curve_settings = []
+        self._cached_settings = None  # get_selected_curves() result until the next change
         self.initUI()
 
     def initUI(self):
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         # Top row: Track label and Delete Track button.
         top_layout = QHBoxLayout()
         top_layout.addWidget(QLabel(f"Track {self.number}"))
@@ -109,13 +344,16 @@ class TrackControl(QWidget):
         
         # Primary curve control (always visible)
         self.primary_control = PrimaryCurveControl(self.curves)
-        self.primary_control.changed.connect(self.changed)
+        self.primary_control.changed.connect(self._on_changed)
         main_layout.addWidget(self.primary_control)
         
         # Secondary curves control
         sec_layout = QVBoxLayout()
         sec_layout.addWidget(QLabel("Secondary Curves:"))
-        self.secondary_list = QListWidget()
+        self.secondary_model = SecondaryCurveModel(self.secondary_curve_settings, self)
+        self.secondary_list = QListView()
+        self.secondary_list.setModel(self.secondary_model)
+        self.secondary_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
         sec_layout.addWidget(self.secondary_list)
         btn_layout = QHBoxLayout()
         self.btn_add_secondary = QPushButton("Add Secondary")
@@ -126,36 +364,43 @@ class TrackControl(QWidget):
         btn_layout.addWidget(self.btn_remove_secondary)
         sec_layout.addLayout(btn_layout)
         main_layout.addLayout(sec_layout)
-        
-        self.setLayout(main_layout)
 
+    @QtCore.pyqtSlot()
     def add_secondary(self):
         item, ok = QtWidgets.QInputDialog.getItem(self, "Select Secondary Curve", "Curve:", self.curves, 0, False)
         if ok and item:
             # Secondary curves do not include a color option.
             settings = {"curve": item, "style": "-", "width": 1, "primary": False}
-            self.secondary_curve_settings.append(settings)
-            self.secondary_list.addItem(item)
-            self.changed.emit()
+            self.secondary_model.append(settings)
+            self._on_changed()
 
+    @QtCore.pyqtSlot()
     def remove_secondary(self):
-        selected_items = self.secondary_list.selectedItems()
-        if not selected_items:
+        rows = sorted((index.row() for index in self.secondary_list.selectionModel().selectedRows()), reverse=True)
+        if not rows:
             return
-        for item in selected_items:
-            row = self.secondary_list.row(item)
-            self.secondary_list.takeItem(row)
-            del self.secondary_curve_settings[row]
+        # Remove from the bottom up so the remaining row numbers stay valid.
+        for row in rows:
+            self.secondary_model.remove(row)
+        self._on_changed()
+
+    @QtCore.pyqtSlot()
+    def _on_changed(self):
+        self._cached_settings = None
         self.changed.emit()
 
     def get_selected_curves(self):
+        if self._cached_settings is not None:
+            return self._cached_settings
         settings_list = []
         primary_settings = self.primary_control.get_settings()
         if primary_settings is not None:
             settings_list.append(primary_settings)
         settings_list.extend(self.secondary_curve_settings)
+        self._cached_settings = settings_list
         return settings_list
 
+    @QtCore.pyqtSlot()
     def handle_delete(self):
         self.deleteRequested.emit(self)
 
@@ -195,6 +440,7 @@ class CurveSettingsDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    @QtCore.pyqtSlot()
     def chooseColor(self):
         color = QColorDialog.getColor()
         if color.isValid():
@@ -222,15 +468,21 @@ class FigureWidget(QWidget):
         self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         self.zoom_mode = "Pan"  # Default zoom mode
+        self.well_axes = {}  # well name -> list of track axes, left to right
+        self._layout_key = None  # (well names, track ids) the current axes were built for
+        self._artists = {}  # (well name, track index, role, curve) -> Line2D
+        self._placeholders = {}  # (well name, track index) -> "No curve added" text
         layout = QVBoxLayout(self)
         layout.addWidget(self.canvas)
-        self.setLayout(layout)
 
         # Variables for custom zoom/pan.
         self._dragging = False
         self._press_event = None
         self._rect = None  # For rectangular zoom
-        self._zoom_history = []  # Stack to store zoom states
+        self._zoom_history = deque(maxlen=64)  # Recent zoom states, one (n_axes, 4) array each
+        self._bg = None  # Cached background while blitting a drag
+        self._blit_artists = []
+        self._blit_draw = Throttler(self._blit, 30, self)  # Coalesce drag redraws
 
         # Connect mouse events.
         self.canvas.mpl_connect("button_press_event", self.onMousePress)
@@ -239,6 +491,7 @@ class FigureWidget(QWidget):
         self.canvas.mpl_connect("scroll_event", self.onScroll)
         self.canvas.mpl_connect("pick_event", self.onPick)
 
+    @QtCore.pyqtSlot(str)
     def onZoomModeChanged(self, mode):
         self.zoom_mode = mode
         if mode == "Pan":
@@ -262,161 +515,270 @@ class FigureWidget(QWidget):
             self._rect = Rectangle((event.xdata, event.ydata), 0, 0,
                                    fill=False, edgecolor='red', linestyle='--')
             ax.add_patch(self._rect)
-            self.canvas.draw()
+            self._start_blit([self._rect])
         elif self.zoom_mode == "Pan":
             self._dragging = True
             self._press_event = event
+            self._start_blit([line for a in self.figure.axes if a.get_visible() for line in a.lines])
 
-    def onMouseMove(self, event):
-        if not self._dragging or event.inaxes is None or self._press_event is None:
+    def _start_blit(self, artists):
+        # Render everything except the moving artists once, then only repaint those on top.
+        self._blit_artists = artists
+        for artist in artists:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self._bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._blit()
+
+    def _blit(self):
+        if self._bg is None:
             return
+        self.canvas.restore_region(self._bg)
+        for artist in self._blit_artists:
+            artist.axes.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def _end_blit(self):
+        for artist in self._blit_artists:
+            artist.set_animated(False)
+        self._blit_artists = []
+        self._bg = None
+
+    def onMouseMove(self, event):
+        press = self._press_event
         ax = event.inaxes
-        if self.zoom_mode == "Pan":
-            dx = event.xdata - self._press_event.xdata
-            dy = event.ydata - self._press_event.ydata
+        if not self._dragging or ax is None or press is None:
+            return
+        # Read the event attributes once; this runs for every motion event during a drag.
+        xd, yd = event.xdata, event.ydata
+        px, py = press.xdata, press.ydata
+        mode = self.zoom_mode
+        if mode == "Pan":
             if event.key == "control":
+                dy = yd - py
                 y0, y1 = ax.get_ylim()
                 ax.set_ylim(y0 - dy, y1 - dy)
             else:
+                dx = xd - px
                 x0, x1 = ax.get_xlim()
                 ax.set_xlim(x0 - dx, x1 - dx)
-            self.canvas.draw()
+            self._blit_draw()
             self._press_event = event
-        elif self.zoom_mode == "Rectangular" and self._rect is not None:
-            x0, y0 = self._press_event.xdata, self._press_event.ydata
-            x1, y1 = event.xdata, event.ydata
-            xmin = min(x0, x1)
-            ymin = min(y0, y1)
-            width = abs(x1 - x0)
-            height = abs(y1 - y0)
-            self._rect.set_xy((xmin, ymin))
-            self._rect.set_width(width)
-            self._rect.set_height(height)
-            self.canvas.draw()
+        elif mode == "Rectangular":
+            rect = self._rect
+            if rect is None:
+                return
+            rect.set_bounds(min(px, xd), min(py, yd), abs(xd - px), abs(yd - py))
+            self._blit_draw()
 
     def onMouseRelease(self, event):
-        if not self._dragging or event.inaxes is None:
+        was_blitting = self._bg is not None
+        if was_blitting:
+            self._end_blit()
+        # Clear the drag state first so a release outside the axes can't leave it stale.
+        dragging, press, rect = self._dragging, self._press_event, self._rect
+        self._dragging = False
+        self._press_event = None
+        self._rect = None
+        if rect is not None:
+            rect.remove()
+        if not dragging or event.inaxes is None:
+            if was_blitting or rect is not None:
+                self.canvas.draw()
             return
         ax = event.inaxes
-        if self.zoom_mode == "Rectangular" and self._rect is not None:
-            x0, y0 = self._press_event.xdata, self._press_event.ydata
-            x1, y1 = event.xdata, event.ydata
-            xmin, xmax = sorted([x0, x1])
-            ymin, ymax = sorted([y0, y1])
+        if self.zoom_mode == "Rectangular" and rect is not None:
+            xmin, xmax = sorted([press.xdata, event.xdata])
+            ymin, ymax = sorted([press.ydata, event.ydata])
             ax.set_xlim(xmin, xmax)
             ax.set_ylim(ymin, ymax)
-            self._rect.remove()
-            self._rect = None
             self.canvas.draw()
-        self._dragging = False
-        self._press_event = None
+        elif was_blitting:
+            self.canvas.draw()  # Resync ticks and labels after the blitted pan
         self.recordZoomState()
         self.zoomChanged.emit(self)
 
     def onScroll(self, event):
-        if event.inaxes is None:
-            return
         ax = event.inaxes
-        base_scale = 1.1
-        if event.button == "up":
-            scale_factor = 1 / base_scale
-        elif event.button == "down":
-            scale_factor = base_scale
-        else:
-            scale_factor = 1
-
-        if self.zoom_mode == "Horizontal":
-            if event.key == "control":
+        if ax is None:
+            return
+        mode = self.zoom_mode
+        if mode in ("Horizontal", "Vertical"):
+            base_scale = 1.1
+            button = event.button
+            if button == "up":
+                scale_factor = 1 / base_scale
+            elif button == "down":
+                scale_factor = base_scale
+            else:
+                scale_factor = 1
+            # Control swaps the zoom axis in both modes.
+            if (mode == "Vertical") != (event.key == "control"):
                 y0, y1 = ax.get_ylim()
                 ydata = event.ydata
-                new_range = (y1 - y0) * scale_factor
-                ax.set_ylim([ydata - new_range / 2, ydata + new_range / 2])
+                half = (y1 - y0) * scale_factor / 2
+                ax.set_ylim(ydata - half, ydata + half)
             else:
                 x0, x1 = ax.get_xlim()
                 xdata = event.xdata
-                new_range = (x1 - x0) * scale_factor
-                ax.set_xlim([xdata - new_range / 2, xdata + new_range / 2])
-            self.canvas.draw()
-        elif self.zoom_mode == "Vertical":
-            if event.key == "control":
-                x0, x1 = ax.get_xlim()
-                xdata = event.xdata
-                new_range = (x1 - x0) * scale_factor
-                ax.set_xlim([xdata - new_range / 2, xdata + new_range / 2])
-            else:
-                y0, y1 = ax.get_ylim()
-                ydata = event.ydata
-                new_range = (y1 - y0) * scale_factor
-                ax.set_ylim([ydata - new_range / 2, ydata + new_range / 2])
-            self.canvas.draw()
-        else:
-            self.canvas.draw()
+                half = (x1 - x0) * scale_factor / 2
+                ax.set_xlim(xdata - half, xdata + half)
+            self.canvas.draw_idle()
         self.recordZoomState()
         self.zoomChanged.emit(self)
 
+    def _current_limits(self):
+        # One row per axes: x0, x1, y0, y1.
+        return np.array([ax.get_xlim() + ax.get_ylim() for ax in self.figure.axes],
+                        dtype=np.float64).reshape(-1, 4)
+
     def recordZoomState(self):
-        state = []
-        for ax in self.figure.axes:
-            state.append((ax.get_xlim(), ax.get_ylim()))
-        self._zoom_history.append(state)
+        self._zoom_history.append(self._current_limits())
 
+    @QtCore.pyqtSlot()
     def undoZoom(self):
         if len(self._zoom_history) > 1:
             self._zoom_history.pop()
             prev_state = self._zoom_history[-1]
             for ax, limits in zip(self.figure.axes, prev_state):
-                ax.set_xlim(limits[0])
-                ax.set_ylim(limits[1])
+                ax.set_xlim(limits[0], limits[1])
+                ax.set_ylim(limits[2], limits[3])
             self.canvas.draw()
 
+    @QtCore.pyqtSlot()
     def resetZoom(self):
         if not hasattr(self, '_initial_limits'):
             return
         for ax, limits in zip(self.figure.axes, self._initial_limits):
-            ax.set_xlim(limits[0])
-            ax.set_ylim(limits[1])
+            ax.set_xlim(limits[0], limits[1])
+            ax.set_ylim(limits[2], limits[3])
         self.canvas.draw()
-        self._zoom_history = [self._initial_limits.copy()]
+        self._zoom_history = deque([self._initial_limits.copy()], maxlen=64)
+
+    def _on_ylim_changed(self, ax):
+        # Re-decimate over the visible depth window so zooming in reveals full detail.
+        lo, hi = sorted(ax.get_ylim())
+        n_bins = self.canvas.height()
+        # Shared siblings get their limits with emit=False, so refresh their lines here too.
+        lines = [line for sibling in ax.get_shared_y_axes().get_siblings(ax) for line in sibling.lines]
+        for line in lines:
+            source = getattr(line, "decim_source", None)
+            if source is None:
+                continue
+            x, depth = source
+            if depth[0] > depth[-1]:
+                continue
+            i0, i1 = np.searchsorted(depth, [lo, hi])
+            i0 = max(i0 - 1, 0)
+            i1 = min(i1 + 1, len(depth))
+            line.set_data(*_decimate(x[i0:i1], depth[i0:i1], n_bins))
 
-    def update_plot(self, data, tracks, well_name):
+    def _build_axes(self, wells, n_tracks):
+        # wells: list of (well name, well dict); each well gets its own group of track axes.
         self.figure.clear()
-        n_tracks = len(tracks)
-        if n_tracks == 0:
+        self.well_axes = {}
+        self._artists = {}
+        self._placeholders = {}
+        if wells and n_tracks == 0:
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, "No track controls", horizontalalignment='center', verticalalignment='center')
-        else:
-            axes = self.figure.subplots(1, n_tracks, sharey=True)
-            if n_tracks == 1:
-                axes = [axes]
-            depth = data['DEPT']
-            for idx, (ax, track) in enumerate(zip(axes, tracks)):
+        elif wells:
+            outer = self.figure.add_gridspec(1, len(wells), wspace=0.3)
+            for w, (well_name, well) in enumerate(wells):
+                dmin, dmax = well['depth_range']
+                inner = outer[w].subgridspec(1, n_tracks, wspace=0.1)
+                axes = []
+                for idx in range(n_tracks):
+                    ax = self.figure.add_subplot(inner[0, idx], sharey=axes[0] if axes else None)
+                    axes.append(ax)
+                    self._placeholders[(well_name, idx)] = ax.text(
+                        0.5, 0.5, "No curve added", horizontalalignment='center',
+                        verticalalignment='center', transform=ax.transAxes, visible=False)
+                    if idx == 0:
+                        ax.set_ylabel("Depth")
+                    else:
+                        ax.tick_params(labelleft=False)
+                    ax.grid(True)
+                axes[0].set_title(well_name)
+                # Shared y: setting the limits once on the first axes covers the whole well.
+                axes[0].set_ylim(dmax, dmin)
+                for ax in axes:
+                    ax.callbacks.connect('ylim_changed', self._on_ylim_changed)
+                self.well_axes[well_name] = axes
+
+    def set_visible_span(self, left, right):
+        # Hide the axes of wells scrolled outside [left, right] (canvas pixels); Agg skips
+        # invisible axes, so only the wells on screen are rasterized.
+        width = self.canvas.width()
+        changed = False
+        for axes in self.well_axes.values():
+            x0 = axes[0].get_position().x0 * width
+            x1 = axes[-1].get_position().x1 * width
+            visible = x1 >= left and x0 <= right
+            for ax in axes:
+                if ax.get_visible() != visible:
+                    ax.set_visible(visible)
+                    changed = True
+        if changed:
+            self.canvas.draw_idle()
+
+    def update_plot(self, wells, tracks):
+        # Axes are rebuilt only when the wells or tracks themselves change; otherwise
+        # existing Line2D artists are restyled in place and only new curves are plotted.
+        layout_key = (tuple(name for name, _ in wells), tuple(id(track) for track in tracks))
+        rebuilt = layout_key != self._layout_key
+        if rebuilt:
+            self._build_axes(wells, len(tracks))
+            self._layout_key = layout_key
+        n_bins = self.canvas.height()
+        rescaled = []
+        for well_name, well in wells:
+            data = well['data']
+            depth = well['depth']
+            decim = well.setdefault('decim', {})
+            for idx, (ax, track) in enumerate(zip(self.well_axes.get(well_name, ()), tracks)):
                 curve_settings_list = track.get_selected_curves()
-                if not curve_settings_list:
-                    ax.text(0.5, 0.5, "No curve added", horizontalalignment='center', verticalalignment='center')
-                    continue
+                wanted = set()
+                added = False
                 for settings in curve_settings_list:
-                    if settings["curve"] in data.columns:
-                        # For primary curves, use the specified color; for secondary, default to black.
-                        color = settings.get("color", "black")
-                        line, = ax.plot(data[settings["curve"]], depth,
-                                        color=color,
-                                        linewidth=settings["width"],
-                                        linestyle=settings["style"],
-                                        picker=5)
-                        line.custom_settings = settings  # Tag the line with its settings.
+                    if settings["curve"] not in data:
+                        continue
+                    # The same curve can sit in a track as both primary and secondary, each with its own line.
+                    role = "primary" if settings.get("primary", False) else "secondary"
+                    key = (well_name, idx, role, settings["curve"])
+                    wanted.add(key)
+                    line = self._artists.get(key)
+                    if line is None:
+                        dkey = (settings["curve"], n_bins)
+                        if dkey not in decim:
+                            decim[dkey] = _decimate(data[settings["curve"]], depth, n_bins)
+                        line, = ax.plot(*decim[dkey], picker=5)
+                        line.decim_source = (data[settings["curve"]], depth)
+                        self._artists[key] = line
+                        added = True
+                    # For primary curves, use the specified color; for secondary, default to black.
+                    line.set_color(settings.get("color", "black"))
+                    line.set_linewidth(settings["width"])
+                    line.set_linestyle(settings["style"])
+                    line.custom_settings = settings  # Tag the line with its settings.
+                stale = [key for key in self._artists if key[:2] == (well_name, idx) and key not in wanted]
+                for key in stale:
+                    self._artists.pop(key).remove()
+                self._placeholders[(well_name, idx)].set_visible(not curve_settings_list)
                 ax.set_xlabel(", ".join([s["curve"] for s in curve_settings_list if "curve" in s]))
-                ax.set_ylabel("Depth")
-                ax.grid(True)
-                ax.set_ylim(depth.max(), depth.min())
-        self.figure.subplots_adjust(wspace=0.1)
-        self.canvas.draw()
-        self._initial_limits = []
-        state = []
-        for ax in self.figure.axes:
-            limits = (ax.get_xlim(), ax.get_ylim())
-            self._initial_limits.append(limits)
-            state.append(limits)
-        self._zoom_history = [state]
+                if (added or stale) and not rebuilt:
+                    ax.relim()
+                    ax.autoscale_view(scaley=False)
+                    rescaled.append(ax)
+        if rebuilt:
+            self._initial_limits = self._current_limits()
+            self._zoom_history = deque([self._initial_limits.copy()], maxlen=64)
+        elif rescaled:
+            # Keep Reset Zoom in step with the new x-range of restyled tracks.
+            for i, ax in enumerate(self.figure.axes):
+                if ax in rescaled:
+                    self._initial_limits[i, :2] = ax.get_xlim()
+        self.canvas.draw_idle()
 
     def onPick(self, event):
         if not hasattr(event.artist, "get_linestyle"):
@@ -444,6 +806,7 @@ class FigureWidget(QWidget):
                 self.canvas.draw()
         elif action == delete_action:
             line.remove()
+            self._artists = {key: artist for key, artist in self._artists.items() if artist is not line}
             self.canvas.draw()
         self.recordZoomState()
         self.zoomChanged.emit(self)
@@ -454,11 +817,14 @@ class FigureWidget(QWidget):
 class WellLogViewer(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.wells = {}  # well name -> {'data': DataFrame, 'path': filepath}
+        self.wells = {}  # well name -> {'data': {curve: ndarray}, 'depth': ndarray, 'path': filepath, 'depth_range': (min, max)}
         self.tracks = []  # list of TrackControl widgets
         self.track_buttons = []  # buttons for track selection
-        self.figure_widgets = {}  # well name -> FigureWidget
+        self._all_curves = ()  # sorted union of curve names across loaded wells
+        self._last_plot_key = None  # selection + track settings of the last plot
+        self.figure_widget = FigureWidget("all")  # One figure shared by every selected well
         self.sync_zoom_enabled = False
+        self._update_plot_throttle = Throttler(self._do_update_plot, 100, self)
         self.initUI()
         self.setWindowIcon(QIcon('ongc.png'))
 
@@ -496,9 +862,12 @@ class WellLogViewer(QMainWindow):
         self.figure_scroll = QScrollArea()
         self.figure_container = QWidget()
         self.figure_layout = QHBoxLayout(self.figure_container)
-        self.figure_container.setLayout(self.figure_layout)
+        self.figure_widget.zoomChanged.connect(self.handleZoomChanged)
+        self.figure_layout.addWidget(self.figure_widget)
         self.figure_scroll.setWidgetResizable(True)
         self.figure_scroll.setWidget(self.figure_container)
+        self.figure_scroll.horizontalScrollBar().valueChanged.connect(self._refresh_visible)
+        self.figure_scroll.horizontalScrollBar().rangeChanged.connect(self._refresh_visible)
         self.setCentralWidget(self.figure_scroll)
         
         # Menubar and File menu.
@@ -517,7 +886,7 @@ class WellLogViewer(QMainWindow):
         self.dock = QDockWidget("Controls", self)
         self.addDockWidget(Qt.RightDockWidgetArea, self.dock)
         dock_widget = QWidget()
-        dock_layout = QVBoxLayout()
+        dock_layout = QVBoxLayout(dock_widget)
         # Use custom WellListWidget for loaded wells.
         self.well_list = WellListWidget()
         self.well_list.itemChanged.connect(self.update_plot)
@@ -533,62 +902,76 @@ class WellLogViewer(QMainWindow):
         btn_add_track = QPushButton("Add Track")
         btn_add_track.clicked.connect(self.add_track)
         dock_layout.addWidget(btn_add_track)
-        dock_widget.setLayout(dock_layout)
         self.dock.setWidget(dock_widget)
         self.statusBar().showMessage('Ready')
 
+    @QtCore.pyqtSlot(str)
     def onGlobalZoomModeChanged(self, mode):
-        for widget in self.figure_widgets.values():
-            widget.onZoomModeChanged(mode)
+        self.figure_widget.onZoomModeChanged(mode)
 
+    @QtCore.pyqtSlot(bool)
     def onSyncZoomToggled(self, checked):
         self.sync_zoom_enabled = checked
         if checked:
             self.sync_zoom()
 
+    @QtCore.pyqtSlot()
     def toggle_controls(self):
         self.dock.setVisible(not self.dock.isVisible())
 
+    @QtCore.pyqtSlot()
     def load_las_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder Containing LAS Files")
-        if folder:
-            for filename in os.listdir(folder):
-                if filename.lower().endswith(".las"):
-                    full_path = os.path.join(folder, filename)
-                    self.load_las_file(full_path)
-            self.update_plot()
-    
-    def load_las_file(self, path):
-        try:
-            las = lasio.read(path)
-            df = las.df()
-            df.reset_index(inplace=True)
-            df.dropna(inplace=True)
-            depth_col = df.index.name if df.index.name else next((col for col in df.columns if col.upper() in ["DEPT", "DEPTH", "MD"]), None)
-            if depth_col is None:
-                raise ValueError("No valid depth column found.")
-            df.rename(columns={depth_col: "DEPT"}, inplace=True)
-            well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
-            if well_name in self.wells:
-                return
-            self.wells[well_name] = {'data': df, 'path': path}
-            item = QListWidgetItem(well_name)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.well_list.addItem(item)
-            self.statusBar().showMessage(f"Loaded: {well_name}")
-        except Exception as e:
-            self.statusBar().showMessage(f"Error loading {path}: {str(e)}")
+        if not folder:
+            return
+        paths = [os.path.join(folder, filename) for filename in os.listdir(folder)
+                 if filename.lower().endswith(".las")]
+        if not paths:
+            return
+        self._load_progress = QProgressDialog("Loading LAS files...", None, 0, len(paths), self)
+        self._load_progress.setWindowModality(Qt.WindowModal)
+        self._load_progress.setMinimumDuration(0)
+        self._folder_loader = FolderLoader(paths, self)
+        self._folder_loader.loaded.connect(self._on_well_parsed)
+        self._folder_loader.failed.connect(self._on_well_failed)
+        self._folder_loader.finished.connect(self._on_folder_loaded)
+        self._folder_loader.start()
+
+    @QtCore.pyqtSlot(object)
+    def _on_well_parsed(self, result):
+        self._register_well(*result)
+        self._load_progress.setValue(self._load_progress.value() + 1)
+
+    @QtCore.pyqtSlot(str, str)
+    def _on_well_failed(self, path, message):
+        self.statusBar().showMessage(f"Error loading {path}: {message}")
+        self._load_progress.setValue(self._load_progress.value() + 1)
+
+    @QtCore.pyqtSlot()
+    def _on_folder_loaded(self):
+        self._load_progress.close()
+        self._folder_loader.deleteLater()
+        self._folder_loader = None
+        self.update_plot()
+
+    def _register_well(self, well_name, cols, names, path, depth_range):
+        if well_name in self.wells:
+            return
+        self.wells[well_name] = {'data': cols, 'depth': cols['DEPT'], 'path': path,
+                                 'depth_range': depth_range}
+        self._all_curves = tuple(sorted(set(self._all_curves).union(names)))
+        item = QListWidgetItem(well_name)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Unchecked)
+        self.well_list.addItem(item)
+        self.statusBar().showMessage(f"Loaded: {well_name}")
 
+    @QtCore.pyqtSlot()
     def add_track(self):
         if not self.wells:
             self.statusBar().showMessage("No wells loaded!")
             return
-        curves_set = set()
-        for well in self.wells.values():
-            curves_set.update(well['data'].columns)
-        curves = sorted(list(curves_set))
-        track = TrackControl(len(self.tracks) + 1, curves)
+        track = TrackControl(len(self.tracks) + 1, list(self._all_curves))
         track.changed.connect(self.update_plot)
         track.deleteRequested.connect(self.delete_track)
         self.tracks.append(track)
@@ -604,11 +987,13 @@ class WellLogViewer(QMainWindow):
         self.statusBar().showMessage(f"Added Track {track.number}")
         self.update_plot()
 
+    @QtCore.pyqtSlot(int)
     def switch_track(self, index):
         self.track_stack.setCurrentIndex(index)
         for i, btn in enumerate(self.track_buttons):
             btn.setChecked(i == index)
 
+    @QtCore.pyqtSlot(object)
     def delete_track(self, track):
         if track in self.tracks:
             index = self.tracks.index(track)
@@ -624,32 +1009,39 @@ class WellLogViewer(QMainWindow):
             self.update_plot()
 
     def sync_zoom(self):
-        if not self.figure_widgets:
+        well_axes = list(self.figure_widget.well_axes.values())
+        if not well_axes:
             self.statusBar().showMessage("No figures to sync.")
             return
-        ref_widget = list(self.figure_widgets.values())[0]
-        ref_axes = ref_widget.figure.axes
-        for widget in self.figure_widgets.values():
-            for i, ax in enumerate(widget.figure.axes):
-                if i < len(ref_axes):
-                    ax.set_xlim(ref_axes[i].get_xlim())
-                    ax.set_ylim(ref_axes[i].get_ylim())
-            widget.canvas.draw()
-        self.statusBar().showMessage("Zoom synchronized across figures.")
+        ref_axes = well_axes[0]
+        # Block zoomChanged while limits move so handleZoomChanged cannot re-enter sync_zoom.
+        with QtCore.QSignalBlocker(self.figure_widget):
+            for axes in well_axes[1:]:
+                for i, ax in enumerate(axes):
+                    if i < len(ref_axes):
+                        ax.set_xlim(ref_axes[i].get_xlim())
+                        ax.set_ylim(ref_axes[i].get_ylim())
+        self.figure_widget.canvas.draw_idle()
+        self.statusBar().showMessage("Zoom synchronized across wells.")
 
+    @QtCore.pyqtSlot(object)
     def handleZoomChanged(self, sender):
         if self.sync_zoom_enabled:
             self.sync_zoom()
 
+    @QtCore.pyqtSlot()
     def resetZoom(self):
-        for widget in self.figure_widgets.values():
-            widget.resetZoom()
+        self.figure_widget.resetZoom()
 
+    @QtCore.pyqtSlot()
     def undoZoom(self):
-        for widget in self.figure_widgets.values():
-            widget.undoZoom()
+        self.figure_widget.undoZoom()
 
+    @QtCore.pyqtSlot()
     def update_plot(self):
+        self._update_plot_throttle()
+
+    def _do_update_plot(self):
         selected_wells = []
         for i in range(self.well_list.count()):
             item = self.well_list.item(i)
@@ -657,21 +1049,22 @@ class WellLogViewer(QMainWindow):
                 well_name = item.text()
                 if well_name in self.wells:
                     selected_wells.append(well_name)
-        for well in list(self.figure_widgets.keys()):
-            if well not in selected_wells:
-                widget = self.figure_widgets[well]
-                self.figure_layout.removeWidget(widget)
-                widget.setParent(None)
-                widget.deleteLater()
-                del self.figure_widgets[well]
-        for well in selected_wells:
-            if well not in self.figure_widgets:
-                fig_widget = FigureWidget(well)
-                fig_widget.zoomChanged.connect(self.handleZoomChanged)
-                self.figure_widgets[well] = fig_widget
-                self.figure_layout.addWidget(fig_widget)
-            data = self.wells[well]['data']
-            self.figure_widgets[well].update_plot(data, self.tracks, well)
+        # itemChanged also fires for text/icon edits; skip the replot if nothing that is drawn changed.
+        key = (tuple(selected_wells),
+               tuple((id(t), tuple(tuple(sorted(c.items())) for c in t.get_selected_curves())) for t in self.tracks))
+        if key == self._last_plot_key:
+            return
+        self._last_plot_key = key
+        # Keep roughly the old per-well figure width so the scroll area still kicks in.
+        self.figure_widget.setMinimumWidth(300 * len(selected_wells))
+        self.figure_widget.update_plot([(well, self.wells[well]) for well in selected_wells], self.tracks)
+        self._refresh_visible()
+
+    @QtCore.pyqtSlot()
+    def _refresh_visible(self):
+        viewport = self.figure_scroll.viewport()
+        left = -self.figure_widget.canvas.mapTo(viewport, QtCore.QPoint(0, 0)).x()
+        self.figure_widget.set_visible_span(left, left + viewport.width())
 
 # ----------------------------------------------------------------------
 # Main entry point
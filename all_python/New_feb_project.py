@@ -1,38 +1,273 @@
 import sys
 import os
-import lasio
 import numpy as np
 import pandas as pd
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtWidgets import QGroupBox
 from PyQt5.QtWidgets import QColorDialog
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (QMainWindow, QFileDialog, QDockWidget, QListWidget,
                              QListWidgetItem, QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
                              QComboBox, QPushButton, QCheckBox, QSpinBox, QScrollArea, QAction)
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# ----------------------------------------------------------------------
+# Min/max decimation: reduce a curve to ~2*n_target points, keeping each bucket's
+# extremes so spikes survive. x is the curve, y the depth it is plotted against.
+# The outputs are freshly allocated on purpose: callers keep them in the well's
+# decimation cache, so they must never alias a reused scratch buffer.
+# ----------------------------------------------------------------------
+def _decimate(x, y, n_target=2000):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= 2 * n_target:
+        return x, y
+    out_x = np.empty(2 * n_target)
+    out_y = np.empty(2 * n_target)
+    if njit is not None:
+        _minmax_kernel(x, y, out_x, out_y)
+        return out_x, out_y
+    starts = np.linspace(0, n, n_target + 1, dtype=int)[:-1]
+    ends = np.append(starts[1:], n) - 1
+    # fmin/fmax skip NaN gaps unless the whole bucket is missing.
+    out_x[0::2] = np.fmin.reduceat(x, starts)
+    out_x[1::2] = np.fmax.reduceat(x, starts)
+    out_y[0::2] = y[starts]
+    out_y[1::2] = y[ends]
+    return out_x, out_y
+
+if njit is not None:
+    # Single pass per bucket with no temporaries. Keeps the depth at which each
+    # extreme actually occurs, emitted in depth order. NaN samples are skipped
+    # unless the whole bucket is NaN (so no fastmath: it would drop the NaN tests).
+    @njit(parallel=True, cache=True)
+    def _minmax_kernel(x, y, out_x, out_y):
+        n = x.shape[0]
+        n_buckets = out_x.shape[0] // 2
+        step = n / n_buckets
+        for b in prange(n_buckets):
+            lo = int(b * step)
+            hi = n if b == n_buckets - 1 else int((b + 1) * step)
+            imn = lo
+            imx = lo
+            for i in range(lo + 1, hi):
+                v = x[i]
+                if v < x[imn] or x[imn] != x[imn]:
+                    imn = i
+                if v > x[imx] or x[imx] != x[imx]:
+                    imx = i
+            first = min(imn, imx)
+            second = max(imn, imx)
+            out_x[2 * b] = x[first]
+            out_y[2 * b] = y[first]
+            out_x[2 * b + 1] = x[second]
+            out_y[2 * b + 1] = y[second]
+
+# ----------------------------------------------------------------------
+# Curve value transforms for track display. numexpr evaluates in cache-sized blocks
+# across threads; plain NumPy is the fallback when it is not installed.
+# ----------------------------------------------------------------------
+_TRANSFORMS = {"linear": "x", "log": "log10(x)"}
+
+def _transform(x, kind):
+    if kind == "linear":
+        return x
+    if ne is not None:
+        return ne.evaluate(_TRANSFORMS[kind], local_dict={"x": x})
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log10(x)
+
+# ----------------------------------------------------------------------
+# LAS parsing is split in two: _read_header lists a well (name + curve mnemonics) without
+# touching the ~A section, and _read_data parses the samples the first time a well is
+# plotted. _read_header runs on worker threads during folder loads, so it must not touch widgets.
+# ----------------------------------------------------------------------
+def _read_header(path):
+    # lasio is imported on first use so the window opens without paying for it.
+    import lasio
+    las = lasio.read(path, ignore_data=True)
+    curves = [curve.mnemonic for curve in las.curves]
+    # Find a valid depth column.
+    depth_col = next((col for col in curves if col.upper() in ["DEPT", "DEPTH", "MD"]), None)
+    if depth_col is None:
+        raise ValueError("No valid depth column found.")
+    curves[curves.index(depth_col)] = "DEPT"
+    well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
+    return well_name, curves, path
+
+def _read_data(path):
+    import lasio
+    try:
+        las, df = _read_ascii_section(path)
+    except Exception:
+        try:
+            # lasio's vectorised reader; it falls back to the line parser itself for wrapped files.
+            las = lasio.read(path, engine="numpy")
+        except TypeError:
+            las = lasio.read(path)  # lasio without the engine option
+        df = las.df()
+        df.reset_index(inplace=True)
+    depth_col = next(col for col in df.columns if col.upper() in ["DEPT", "DEPTH", "MD"])
+    df.rename(columns={depth_col: "DEPT"}, inplace=True)
+    # Contiguous float64 column arrays for the plot path; the DataFrame stays for everything else.
+    arr = {col: np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)) for col in df.columns}
+    # Turn any NULL sentinels the parser left behind into NaN once, here, so plots show gaps
+    # instead of -999.25 spikes and matplotlib never has to deal with them per draw.
+    null_val = _null_value(las)
+    for values in arr.values():
+        np.putmask(values, values == null_val, np.nan)
+    return df, arr
+
+def _null_value(las):
+    try:
+        return float(las.well.NULL.value)
+    except (KeyError, AttributeError, TypeError, ValueError):
+        return -999.25
+
+def _read_ascii_section(path):
+    # Unwrapped files only: lasio parses the header, pandas' C tokenizer the ~A block.
+    # Anything irregular raises, and _read_data falls back to lasio for the whole file.
+    import lasio
+    with open(path, "r", errors="replace") as f:
+        ascii_line = next(i for i, line in enumerate(f) if line.lstrip().upper().startswith("~A"))
+    las = lasio.read(path, ignore_data=True)
+    if "WRAP" in las.version and str(las.version.WRAP.value).strip().upper() == "YES":
+        raise ValueError("Wrapped LAS data section")
+    df = pd.read_csv(path, skiprows=ascii_line + 1, sep=r"\s+", header=None,
+                     names=[curve.mnemonic for curve in las.curves], dtype=np.float64,
+                     na_values=[_null_value(las)], comment="#", engine="c")
+    return las, df
+
+# ----------------------------------------------------------------------
+# LasLoadTask: parses one LAS file on a QThreadPool worker. The shared LasLoadSignals
+# object lives on the GUI thread, so its signals are delivered there (queued).
+# ----------------------------------------------------------------------
+class LasLoadSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(object)    # (well_name, curves, path)
+    failed = QtCore.pyqtSignal(str, str)  # path, error message
+
+
+class LasLoadTask(QtCore.QRunnable):
+    def __init__(self, path, signals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = _read_header(self.path)
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+        else:
+            self.signals.loaded.emit(result)
 
 # ----------------------------------------------------------------------
 # FigureWidget Class: A widget that embeds a matplotlib figure and canvas.
 # This widget displays the plot for a single well.
 # ----------------------------------------------------------------------
 class FigureWidget(QWidget):
+    hidpi = False  # Render at the screen's device pixel ratio (sharper, up to 4x the Agg pixels)
+    n_target = 2000  # Decimation buckets per curve
+
     def __init__(self, well_name, parent=None):
         super().__init__(parent)
+        # matplotlib is imported with the first figure rather than at startup.
+        import matplotlib
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        # Let Agg drop vertices that fall within a pixel of the path and stroke long
+        # paths in chunks; cheap insurance for curves that bypass decimation.
+        matplotlib.rcParams.update({'path.simplify': True,
+                                    'path.simplify_threshold': 1.0,
+                                    'agg.path.chunksize': 10000})
         self.well_name = well_name
-        self.figure = Figure()
+        # No layout engine: the track grid is fixed by the GridSpec built in _rebuild.
+        self.figure = Figure(figsize=(4, 8), dpi=90, constrained_layout=False, tight_layout=False)
         self.canvas = FigureCanvas(self.figure)
+        # matplotlib sizes its Agg buffer from devicePixelRatioF(); report 1 unless HiDPI is
+        # on, so a ratio-2 screen does not quadruple the bytes rendered and copied per paint.
+        self.canvas.devicePixelRatioF = self._canvas_pixel_ratio
        
         layout = QVBoxLayout(self)
        
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
-    
-    def update_plot(self, data, tracks, well_name):
-        self.figure.clear()
+        self._axes = []          # Axes of the current layout, one per track
+        self._lines = {}         # id(track) -> Line2D of that track's curve
+        self._layout_key = None  # (track id, curve) pairs the axes were built for
+        self._bgs = []           # Per-axes background (everything but the curve), for blitting
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _canvas_pixel_ratio(self):
+        return QWidget.devicePixelRatioF(self.canvas) if FigureWidget.hidpi else 1.0
+
+    def refresh_pixel_ratio(self):
+        # matplotlib >= 3.5 caches the ratio; older versions re-read it on every draw.
+        update = getattr(self.canvas, "_update_pixel_ratio", None)
+        if update is not None:
+            update()
+        self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        # Curves are animated, so a full draw renders everything else; grab that as the
+        # blit background, then paint the curves on top into the same buffer.
+        self._bgs = [self.canvas.copy_from_bbox(ax.bbox) for ax in self._axes]
+        for line in self._lines.values():
+            line.axes.draw_artist(line)
+
+    def fast_update(self, tracks):
+        # Color/style/width changes: repaint only the curve over the cached background.
+        for track in tracks:
+            line = self._lines.get(id(track))
+            if line is not None:
+                line.set_color(track.color.currentText())
+                line.set_linewidth(track.width.value())
+                line.set_linestyle(track.style.currentText())
+        if len(self._bgs) != len(self._axes):
+            # No background yet (not drawn since the last rebuild): the full draw picks up the new style.
+            self.canvas.draw_idle()
+            return
+        for ax, bg, track in zip(self._axes, self._bgs, tracks):
+            line = self._lines.get(id(track))
+            if line is None:
+                continue
+            self.canvas.restore_region(bg)
+            ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
+
+    def update_plot(self, data, tracks, well_name, depth_range, decim):
+        # Rebuild the axes only when tracks or curve selections change; color, style,
+        # width, grid and flip are applied to the existing artists. decim is the well's
+        # decimation cache: (curve, kind, n_target) -> (x, depth).
+        layout_key = tuple((id(track), track.curve.currentText(), track.log.isChecked()) for track in tracks)
+        if layout_key != self._layout_key:
+            self._rebuild(data, tracks, well_name, depth_range, decim)
+            self._layout_key = layout_key
+        for ax, track in zip(self._axes, tracks):
+            line = self._lines.get(id(track))
+            if line is not None:
+                line.set_color(track.color.currentText())
+                line.set_linewidth(track.width.value())
+                line.set_linestyle(track.style.currentText())
+            ax.grid(track.grid.isChecked())
+            if ax.xaxis_inverted() != track.flip.isChecked():
+                ax.invert_xaxis()
+        self.canvas.draw_idle()
+
+    def _rebuild(self, data, tracks, well_name, depth_range, decim):
+        self.figure.clf()
+        self._axes = []
+        self._lines = {}
+        self._bgs = []
         n_tracks = len(tracks)
         if n_tracks == 0:
             ax = self.figure.add_subplot(111)
@@ -40,9 +275,10 @@ class FigureWidget(QWidget):
             
         else:
             # Create one subplot per track sharing the y-axis.
-            axes = self.figure.subplots(1, n_tracks, sharey=True)
+            axes = self.figure.subplots(1, n_tracks, sharey=True, gridspec_kw={'wspace': 0.1})
             if n_tracks == 1:
                 axes = [axes]
+            self._axes = list(axes)
                 
             depth = data['DEPT']
             for idx, (ax, track) in enumerate(zip(axes, tracks)):
@@ -50,25 +286,26 @@ class FigureWidget(QWidget):
                 if curve == "Select Curve":
                     ax.text(0.5, 0.5, "No curve selected", horizontalalignment='center', verticalalignment='center')
                     continue
-                if curve in data.columns:
-                    ax.plot(data[curve], depth,
-                            color=track.color.currentText(),
-                            linewidth=track.width.value(),
-                            linestyle=track.style.currentText())
-                ax.set_xlabel(curve)
+                if curve in data:
+                    kind = "log" if track.log.isChecked() else "linear"
+                    key = (curve, kind, self.n_target)
+                    if key not in decim:
+                        decim[key] = _decimate(_transform(data[curve], kind), depth, self.n_target)
+                    line, = ax.plot(*decim[key],
+                                    color=track.color.currentText(),
+                                    linewidth=track.width.value(),
+                                    linestyle=track.style.currentText(),
+                                    animated=True)
+                    self._lines[id(track)] = line
+                ax.set_xlabel(f"log10({curve})" if track.log.isChecked() else curve)
                 # Only the first subplot gets the "Depth" label.
                 if idx == 0:
                     ax.set_ylabel("Depth")
                 else:
                     ax.set_ylabel("")
-                ax.grid(track.grid.isChecked())
-                if track.flip.isChecked():
-                    ax.invert_xaxis()
-                ax.set_ylim(depth.max(), depth.min())
-                ax.legend([well_name])
-
-        self.figure.subplots_adjust(wspace=0.1)
-        self.canvas.draw()
+                ax.set_ylim(depth_range[1], depth_range[0])
+            # One figure-level label instead of an identical legend on every track.
+            self._suptitle = self.figure.suptitle(well_name, fontsize=9, y=0.99)
 
 # ----------------------------------------------------------------------
 # WellLogViewer Class: Main window that holds controls and a horizontal scrollable area
@@ -77,9 +314,20 @@ class FigureWidget(QWidget):
 class WellLogViewer(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.wells = {}               # Loaded wells: well name -> {'data': DataFrame, 'path': filepath}
+        self.wells = {}               # Loaded wells: well name -> {'data': DataFrame, 'arr': {col: ndarray}, 'curves': [names], 'path': filepath, 'decim': {...}}
         self.tracks = []              # List of active track controls
         self.figure_widgets = {}      # Map well name -> FigureWidget
+        self._pending_loads = 0       # Folder-load tasks still running
+        self._all_curves = set()      # Union of curve names across loaded wells
+        self._sorted_curves = None    # sorted(self._all_curves), rebuilt after a load
+        self._load_signals = LasLoadSignals(self)
+        self._load_signals.loaded.connect(self._on_las_loaded)
+        self._load_signals.failed.connect(self._on_las_failed)
+        # Coalesce bursts of changed/itemChanged signals into a single redraw.
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(30)
+        self._redraw_timer.timeout.connect(self._do_update_plot)
         self.initUI()
        
         
@@ -113,6 +361,11 @@ class WellLogViewer(QMainWindow):
         change_bg_action = QAction("Change Background Color", self)
         change_bg_action.triggered.connect(self.change_background_color)
         menubar.addAction(change_bg_action)
+
+        hidpi_action = QAction("HiDPI Rendering", self)
+        hidpi_action.setCheckable(True)
+        hidpi_action.toggled.connect(self.set_hidpi)
+        menubar.addAction(hidpi_action)
         
         # Create a dock widget for controls.
         self.dock = QDockWidget("Controls", self)
@@ -148,6 +401,11 @@ class WellLogViewer(QMainWindow):
         self.statusBar().showMessage('Ready')
 
 
+    def set_hidpi(self, enabled):
+        FigureWidget.hidpi = enabled
+        for widget in self.figure_widgets.values():
+            widget.refresh_pixel_ratio()
+
     def change_background_color(self):
         """Opens a color picker to change the background color."""
         color = QColorDialog.getColor()
@@ -160,45 +418,72 @@ class WellLogViewer(QMainWindow):
     def load_las_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder Containing LAS Files")
         if folder:
-            for filename in os.listdir(folder):
-                if filename.lower().endswith(".las"):
-                    full_path = os.path.join(folder, filename)
-                    self.load_las_file(full_path)
-            self.update_plot()
+            # Parse on the global thread pool; results come back through _on_las_loaded.
+            pool = QtCore.QThreadPool.globalInstance()
+            with os.scandir(folder) as it:
+                paths = [entry.path for entry in it
+                         if entry.is_file() and entry.name.lower().endswith(".las")]
+            if paths and self._pending_loads == 0:
+                # New items arrive one by one; hold itemChanged and repaints until the batch is in.
+                self.well_list.blockSignals(True)
+                self.well_list.setUpdatesEnabled(False)
+            for full_path in paths:
+                self._pending_loads += 1
+                pool.start(LasLoadTask(full_path, self._load_signals))
     
-    def load_las_file(self, path):
-        try:
-            las = lasio.read(path)
-            df = las.df()
-            df.reset_index(inplace=True)
-            # Find a valid depth column.
-            depth_col = next((col for col in df.columns if col.upper() in ["DEPT", "DEPTH", "MD"]), None)
-            if depth_col is None:
-                raise ValueError("No valid depth column found.")
-            df.rename(columns={depth_col: "DEPT"}, inplace=True)
-            well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
-            if well_name in self.wells:
-                return
-            self.wells[well_name] = {'data': df, 'path': path}
-            # Create checkable list item (unchecked by default).
-            item = QListWidgetItem(well_name)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.well_list.addItem(item)
-            self.statusBar().showMessage(f"Loaded: {well_name}")
-        except Exception as e:
-            self.statusBar().showMessage(f"Error loading {path}: {str(e)}")
+    def _register_well(self, well_name, curves, path):
+        if well_name in self.wells:
+            return
+        # Samples are parsed on first use by _ensure_data_loaded.
+        self.wells[well_name] = {'data': None, 'arr': None, 'curves': curves, 'path': path, 'decim': {}}
+        self._all_curves.update(curves)
+        self._sorted_curves = None
+        # Create checkable list item (unchecked by default).
+        item = QListWidgetItem(well_name)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Unchecked)
+        self.well_list.addItem(item)
+        self.statusBar().showMessage(f"Loaded: {well_name}")
+
+    def _ensure_data_loaded(self, well_name):
+        well = self.wells[well_name]
+        if well['arr'] is None:
+            try:
+                well['data'], well['arr'] = _read_data(well['path'])
+                well['decim'] = {}  # Decimated curves belong to the samples they came from.
+                depth = well['arr']['DEPT']
+                # Computed once here so redraws never rescan the depth column.
+                well['depth_min'] = float(np.nanmin(depth))
+                well['depth_max'] = float(np.nanmax(depth))
+            except Exception as e:
+                self.statusBar().showMessage(f"Error loading {well['path']}: {str(e)}")
+                return False
+        return True
+
+    def _on_las_loaded(self, result):
+        self._register_well(*result)
+        self._finish_load()
+
+    def _on_las_failed(self, path, message):
+        self.statusBar().showMessage(f"Error loading {path}: {message}")
+        self._finish_load()
+
+    def _finish_load(self):
+        self._pending_loads -= 1
+        if self._pending_loads == 0:
+            self.well_list.setUpdatesEnabled(True)
+            self.well_list.blockSignals(False)
+            self.update_plot()
 
     def add_track(self):
         if not self.wells:
             self.statusBar().showMessage("No wells loaded!")
             return
-        curves_set = set()
-        for well in self.wells.values():
-            curves_set.update(well['data'].columns)
-        curves = sorted(list(curves_set))
-        track = TrackControl(len(self.tracks) + 1, curves)
+        if self._sorted_curves is None:
+            self._sorted_curves = sorted(self._all_curves)
+        track = TrackControl(len(self.tracks) + 1, self._sorted_curves)
         track.changed.connect(self.update_plot)
+        track.styleChanged.connect(self.update_style)
         track.deleteRequested.connect(self.delete_track)
         self.tracks.append(track)
         self.track_container.addWidget(track)
@@ -214,23 +499,25 @@ class WellLogViewer(QMainWindow):
             self.update_plot()
 
     def update_plot(self):
+        self._redraw_timer.start()
+
+    def update_style(self):
+        for widget in self.figure_widgets.values():
+            widget.fast_update(self.tracks)
+
+    def _do_update_plot(self):
         # Gather selected wells.
         selected_wells = []
         for i in range(self.well_list.count()):
             item = self.well_list.item(i)
             if item.checkState() == Qt.Checked:
                 well_name = item.text()
-                if well_name in self.wells:
+                if well_name in self.wells and self._ensure_data_loaded(well_name):
                     selected_wells.append(well_name)
                     
-        # Remove figure widgets for deselected wells.
-        for well in list(self.figure_widgets.keys()):
-            if well not in selected_wells:
-                widget = self.figure_widgets[well]
-                self.figure_layout.removeWidget(widget)
-                widget.setParent(None)
-                widget.deleteLater()
-                del self.figure_widgets[well]
+        # Hide figure widgets for deselected wells; they keep their canvas for re-selection.
+        for well, widget in self.figure_widgets.items():
+            widget.setVisible(well in selected_wells)
                 
         # For each selected well, create/update its FigureWidget.
         for well in selected_wells:
@@ -238,8 +525,9 @@ class WellLogViewer(QMainWindow):
                 fig_widget = FigureWidget(well)
                 self.figure_widgets[well] = fig_widget
                 self.figure_layout.addWidget(fig_widget)
-            data = self.wells[well]['data']
-            self.figure_widgets[well].update_plot(data, self.tracks, well)
+            info = self.wells[well]
+            self.figure_widgets[well].update_plot(info['arr'], self.tracks, well,
+                                                  (info['depth_min'], info['depth_max']), info['decim'])
 
     
 
@@ -248,6 +536,7 @@ class WellLogViewer(QMainWindow):
 # ----------------------------------------------------------------------
 class TrackControl(QWidget):
     changed = QtCore.pyqtSignal()
+    styleChanged = QtCore.pyqtSignal()  # Color/style/width only: handled by a blit, no relayout
     deleteRequested = QtCore.pyqtSignal(object)  # Signal to request deletion of this track
 
     def __init__(self, number, curves):
@@ -279,16 +568,16 @@ class TrackControl(QWidget):
 
         self.color = QComboBox()
         self.color.addItems(["black", "red", "blue", "green", "orange"])
-        self.color.currentIndexChanged.connect(self.changed)
+        self.color.currentIndexChanged.connect(self.styleChanged)
 
         self.style = QComboBox()
         self.style.addItems(["-", "--", ":", "-."])
-        self.style.currentIndexChanged.connect(self.changed)
+        self.style.currentIndexChanged.connect(self.styleChanged)
 
         self.width = QSpinBox()
         self.width.setRange(1, 5)
         self.width.setValue(1)
-        self.width.valueChanged.connect(self.changed)
+        self.width.valueChanged.connect(self.styleChanged)
 
         self.grid = QCheckBox("Grid")
         self.grid.stateChanged.connect(self.changed)
@@ -296,6 +585,9 @@ class TrackControl(QWidget):
         self.flip = QCheckBox("Flip")
         self.flip.stateChanged.connect(self.changed)
 
+        self.log = QCheckBox("Log")
+        self.log.stateChanged.connect(self.changed)
+
         controls_layout.addWidget(QLabel("Curve:"))
         controls_layout.addWidget(self.curve)
         controls_layout.addWidget(QLabel("Color:"))
@@ -306,6 +598,7 @@ class TrackControl(QWidget):
         controls_layout.addWidget(self.width)
         controls_layout.addWidget(self.grid)
         controls_layout.addWidget(self.flip)
+        controls_layout.addWidget(self.log)
 
         # Add layouts into the group box
         group_layout.addLayout(header_layout)
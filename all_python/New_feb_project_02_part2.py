@@ -1,7 +1,8 @@
 import sys
 import os
 import lasio
-import pickle
+import json
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import QDialog, QFileDialog, QMenu, QVBoxLayout, QFormLayout, QLabel, QLineEdit, QDialogButtonBox
 
 import numpy as np
@@ -10,131 +11,280 @@ from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import (QLineEdit, QMainWindow, QFileDialog, QDockWidget, QListWidget,
                              QListWidgetItem, QVBoxLayout, QHBoxLayout, QWidget, QLabel,
                              QComboBox, QPushButton, QCheckBox, QSpinBox, QScrollArea,
-                             QAction, QColorDialog, QTabWidget, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QAction, QColorDialog, QTabWidget, QFrame, QStyle, QStyleOptionViewItem)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtGui import QCursor
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
 import matplotlib.pyplot as plt
 
-# --- Custom QListWidget: Clicking on an item's label toggles its check state ---
-class ClickableListWidget(QtWidgets.QListWidget):
-    def mousePressEvent(self, event):
-        item = self.itemAt(event.pos())
-        if item is not None:
-            rect = self.visualItemRect(item)
-            # Assume the checkbox is within the left 20 pixels.
-            if event.pos().x() > rect.left() + 20:
-                if item.checkState() == Qt.Checked:
-                    item.setCheckState(Qt.Unchecked)
-                else:
-                    item.setCheckState(Qt.Checked)
-                return
-        super().mousePressEvent(event)
+def _parse_las(path):
+    """Read a LAS file into (well_name, well record). No Qt, so it can run in a worker thread."""
+    las = lasio.read(path)
+    # Find a valid depth column.
+    mnemonics = las.keys()
+    is_depth = pd.Index(mnemonics).str.upper().isin(["DEPT", "DEPTH", "MD"])
+    if not is_depth.any():
+        raise ValueError("No valid depth column found.")
+    depth_mnemonic = mnemonics[is_depth.argmax()]
+
+    well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
+
+    names = tuple("DEPT" if m == depth_mnemonic else m for m in mnemonics)
+    depth = np.asarray(las[depth_mnemonic])
+    # Curves are copied out so the record does not keep the LAS object (and its
+    # float64 copy of every curve) alive. float32 is ample for log values; depth
+    # stays float64. Each curve keeps its own finite mask, so a gap in one curve
+    # never drops those depths from another. Gap-free curves store None.
+    curves = {}
+    for mnemonic, name in zip(mnemonics, names):
+        values = depth if name == "DEPT" else np.asarray(las[mnemonic], dtype=np.float32)
+        finite = np.isfinite(values)
+        curves[name] = (values, None if finite.all() else finite)
+    # Depth bounds are fixed per well; computed once here, not per track per replot.
+    return well_name, {'curves': curves, 'depth': depth,
+                       'depth_range': (float(np.nanmin(depth)), float(np.nanmax(depth))),
+                       'names': names, 'path': path}
+
+def _decimate(values, depth, n_target):
+    """Min/max-bin a curve down to about n_target points (values must be finite)."""
+    n = len(values)
+    if n <= n_target:
+        return values, depth
+    n_bins = n_target // 2
+    starts = np.linspace(0, n, n_bins + 1, dtype=int)[:-1]
+    ends = np.append(starts[1:], n) - 1
+    out_values = np.empty(2 * n_bins, dtype=values.dtype)
+    out_depth = np.empty(2 * n_bins, dtype=depth.dtype)
+    # Each bin keeps its extremes, so spikes survive; pinned to the bin's depth span.
+    out_values[0::2] = np.minimum.reduceat(values, starts)
+    out_values[1::2] = np.maximum.reduceat(values, starts)
+    out_depth[0::2] = depth[starts]
+    out_depth[1::2] = depth[ends]
+    return out_values, out_depth
 
 class FigureWidget(QWidget):
     mouse_moved = pyqtSignal(float, float)  # Signal to sync mouse movement
     curve_clicked = pyqtSignal(str, object)  # Signal to indicate a curve was clicked, passing curve name and curve object
 
-    def __init__(self, well_name, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.well_name = well_name
         self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
+        self.canvas.setAttribute(Qt.WA_OpaquePaintEvent)  # Agg fills every pixel; skip Qt's background erase
         layout = QVBoxLayout(self)
         layout.addWidget(self.canvas)
         self.setLayout(layout)
+        # Axes are laid out well by well, one per track: index = well_idx * n_tracks + track_idx.
+        self._axes = []
+        self._n_tracks = 0
+        self._collections = {}  # axes index -> (LineCollection, [curve index in the track per segment])
+        self._auto_xlim = {}  # axes index -> x-limits autoscaled from the data
+        self._structure_key = None
+        self._view_key = None  # Per-track axes settings the last full draw used
+        self._bgs = []  # Per-axes background (everything but the curves), for blitting
+        self._n_target = 0  # Decimation target the current curves were built with
+        self._resize_pending = False  # A resize-triggered rebuild is queued
+        self.wells = []  # [(well_name, data)] in display order
+        self.tracks = []
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
 
-        # Connect mouse move event
-
-        self.canvas.mpl_connect("button_press_event", self.on_click)
+        # Matplotlib does the hit test against the actual curves.
+        self.canvas.mpl_connect("pick_event", self.on_pick)
 
 
-    def on_click(self, event):
-        """Handle click events to detect which curve was clicked."""
-        if event.inaxes:
-            if event.button == 3:  # Left-click
-                for track in self.tracks:
-                    for curve in track.curves:
-                        curve_name = curve.curve_box.currentText()
-                        if curve_name in self.data.columns:
-                            contains, _ = event.inaxes.contains(event)
-                            if contains:
-                                self.curve_clicked.emit(curve_name, curve)
-                                return
+    def on_pick(self, event):
+        """Emit curve_clicked for the curve segment under a right-click."""
+        if event.mouseevent.button != 3 or event.artist.axes not in self._axes:
+            return
+        idx = self._axes.index(event.artist.axes)
+        entry = self._collections.get(idx)
+        if entry is None or len(event.ind) == 0:
+            return
+        # event.ind indexes the collection's segments, i.e. the plotted curves in order.
+        curve = self.tracks[idx % self._n_tracks].curves[entry[1][event.ind[0]]]
+        self.curve_clicked.emit(curve.curve_box.currentText(), curve)
 
-    def update_plot(self, data, tracks):
-        self.figure.clear()
-        self.data = data
+    def update_plot(self, wells, tracks):
+        """Plot every selected well side by side in this one figure."""
+        self.wells = wells
         self.tracks = tracks
-        n_tracks = len(tracks)
+        # Structure = which wells, how many tracks/curves there are and which
+        # columns they show. Anything else (colours, widths, limits, flips,
+        # grid, scale) is applied to the existing artists without clearing the
+        # figure. The key holds no widget identities, so recreating equal
+        # tracks (e.g. loading a config) reuses the axes too.
+        key = (tuple((well_name, id(data)) for well_name, data in wells), tuple(
+            tuple(curve.curve_box.currentText() for curve in track.curves)
+            for track in tracks))
+        view_key = tuple(
+            (track.bg_color, track.grid.isChecked(), track.flip.isChecked(), track.flip_y.isChecked(),
+             track._x_min_val, track._x_max_val, track._y_min_val, track._y_max_val,
+             track.scale_combobox.currentText())
+            for track in tracks)
+        if key != self._structure_key:
+            self._structure_key = key
+            self._rebuild(wells, tracks)
+        elif view_key == self._view_key:
+            # Only curve colour/width/style changed: repaint the curves over the
+            # cached backgrounds instead of redrawing the figure.
+            self._apply_curve_styles()
+            self._blit_curves()
+            return
+        self._view_key = view_key
+        self._restyle(tracks)
+
+    def _decimation_target(self):
+        # Two points (min and max) per vertical pixel of the track, at least 2000,
+        # rounded up to a 256-point bucket so dragging the window edge does not
+        # rebuild the figure on every pixel.
+        height = self._axes[0].bbox.height if self._axes else 0
+        return max(-(-int(2 * height) // 256) * 256, 2000)
+
+    def _on_resize(self, event):
+        # Taller axes need more samples: rebuild the curves at the new target. The
+        # rebuild is queued rather than run inside the canvas' resize handling.
+        if self._axes and not self._resize_pending and self._decimation_target() != self._n_target:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._rebuild_for_resize)
+
+    def _rebuild_for_resize(self):
+        self._resize_pending = False
+        if self._axes and self._decimation_target() != self._n_target:
+            self._structure_key = None
+            self.update_plot(self.wells, self.tracks)
+
+    def _on_draw(self, event):
+        # Curves are animated, so a full draw renders everything else; grab that as the
+        # blit background, then paint the curves on top into the same buffer.
+        self._bgs = [self.canvas.copy_from_bbox(ax.bbox) for ax in self._axes]
+        for lc, _ in self._collections.values():
+            lc.axes.draw_artist(lc)
+
+    def _blit_curves(self):
+        if len(self._bgs) != len(self._axes):
+            self.canvas.draw_idle()
+            return
+        for idx, (ax, bg) in enumerate(zip(self._axes, self._bgs)):
+            if idx not in self._collections:
+                continue
+            self.canvas.restore_region(bg)
+            ax.draw_artist(self._collections[idx][0])
+            self.canvas.blit(ax.bbox)
+
+    def _apply_curve_styles(self):
+        for idx, (lc, plotted) in self._collections.items():
+            track = self.tracks[idx % self._n_tracks]
+            curves = [track.curves[ci] for ci in plotted]
+            lc.set_colors([curve.color for curve in curves])
+            lc.set_linewidths([curve.width.value() for curve in curves])
+            lc.set_linestyles([curve.get_line_style() for curve in curves])
+
+    def _rebuild(self, wells, tracks):
+        """Recreate the axes and line artists from scratch."""
+        self.figure.clear()
+        self._axes = []
+        self._bgs = []
+        self._collections = {}
+        self._auto_xlim = {}
+        self._n_tracks = n_tracks = len(tracks)
+        if not wells:
+            return
         if n_tracks == 0:
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, "No tracks", ha='center', va='center')
-        else:
-            axes = self.figure.subplots(1, n_tracks, sharey=True) if n_tracks > 1 else [self.figure.add_subplot(111)]
-            depth = data['DEPT']
-
-            for idx, (ax, track) in enumerate(zip(axes, tracks)):
-                ax.set_facecolor(track.bg_color)  # **Apply Background Color**
-                if not track.curves:
-                    ax.text(0.5, 0.5, "No curves", ha='center', va='center')
+            return
+
+        # One column group per well; tracks within a well share its depth axis.
+        outer = self.figure.add_gridspec(1, len(wells))
+        for well_idx, (well_name, data) in enumerate(wells):
+            inner = outer[well_idx].subgridspec(1, n_tracks, wspace=0.05)
+            first = self.figure.add_subplot(inner[0, 0])
+            first.set_title(well_name)
+            self._axes.append(first)
+            for track_idx in range(1, n_tracks):
+                self._axes.append(self.figure.add_subplot(inner[0, track_idx], sharey=first))
+        self._n_target = self._decimation_target()
+
+        for idx, ax in enumerate(self._axes):
+            well_name, data = wells[idx // n_tracks]
+            track_idx = idx % n_tracks
+            track = tracks[track_idx]
+            if not track.curves:
+                ax.text(0.5, 0.5, "No curves", ha='center', va='center')
+                continue
+
+            depth = data['depth']
+            curves = data['curves']  # curve name -> (values, finite mask or None)
+            # One LineCollection per track: a single artist for all its curves.
+            segments, plotted = [], []
+            for ci, curve in enumerate(track.curves):
+                curve_name = curve.curve_box.currentText()
+                if curve_name == "Select Curve" or curve_name not in curves:
                     continue
 
-                for curve in track.curves:
-                    curve_name = curve.curve_box.currentText()
-                    if curve_name == "Select Curve" or curve_name not in data.columns:
-                        continue
-
-                    line, = ax.plot(
-                        data[curve_name], depth,
-                        color=curve.color,
-                        linewidth=curve.width.value(),
-                        linestyle=curve.get_line_style(),
-                        picker=True  # Enable picking on the line
-                    )
-                    line.set_gid(curve_name)  # Set an ID for the line
-
-                ax.set_xlabel("Multiple Curves")
-                if idx == 0:
-                    ax.set_ylabel("Depth")
-                ax.grid(track.grid.isChecked())
-                if track.flip.isChecked():
-                    ax.invert_xaxis()
-                ax.set_ylim(depth.max(), depth.min())
-                if track.flip_y.isChecked():  # Flip Y-axis if checked
-                    ax.invert_yaxis()
-
-                # Apply X min/max if values are provided
-                if track.x_min.text():
-                    try:
-                        ax.set_xlim(float(track.x_min.text()), ax.get_xlim()[1])
-                    except ValueError:
-                        pass
-                if track.x_max.text():
-                    try:
-                        ax.set_xlim(ax.get_xlim()[0], float(track.x_max.text()))
-                    except ValueError:
-                        pass
-
-                # Apply Y min/max if values are provided
-                if track.y_min.text():
-                    try:
-                        ax.set_ylim(float(track.y_min.text()), ax.get_ylim()[1])
-                    except ValueError:
-                        pass
-                if track.y_max.text():
-                    try:
-                        ax.set_ylim(ax.get_ylim()[0], float(track.y_max.text()))
-                    except ValueError:
-                        pass
-
-                # Apply scale setting
-                if track.scale_combobox.currentText() == "Log":
-                    ax.set_yscale('log')
-                else:
-                    ax.set_yscale('linear')
-
-        self.canvas.draw()
+                values, finite = curves[curve_name]
+                curve_depth = depth
+                if finite is not None:
+                    values, curve_depth = values[finite], depth[finite]
+                values, curve_depth = _decimate(values, curve_depth, self._n_target)
+                segments.append(np.column_stack([values, curve_depth]))
+                plotted.append(ci)
+
+            if segments:
+                lc = LineCollection(segments, picker=True, pickradius=5, animated=True)  # Enable picking on the curves
+                lc.set_gid(well_name)
+                ax.add_collection(lc)
+                self._collections[idx] = (lc, plotted)
+            ax.autoscale_view()
+            self._auto_xlim[idx] = ax.get_xlim()
+
+            ax.set_xlabel("Multiple Curves")
+            if track_idx == 0:
+                ax.set_ylabel("Depth")
+
+    def _restyle(self, tracks):
+        """Apply per-track/per-curve settings to the cached artists."""
+        self._apply_curve_styles()
+        for idx, ax in enumerate(self._axes):
+            d_lo, d_hi = self.wells[idx // self._n_tracks][1]['depth_range']
+            track = tracks[idx % self._n_tracks]
+            ax.set_facecolor(track.bg_color)  # **Apply Background Color**
+            if not track.curves:
+                continue
+
+            ax.grid(track.grid.isChecked())
+
+            # Apply scale setting
+            if track.scale_combobox.currentText() == "Log":
+                ax.set_yscale('log')
+            else:
+                ax.set_yscale('linear')
+
+            # Start from the data limits so that clearing a box or a flip
+            # restores the automatic range.
+            x0, x1 = self._auto_xlim[idx]
+            if track.flip.isChecked():
+                x0, x1 = x1, x0
+            y0, y1 = d_hi, d_lo
+            if track.flip_y.isChecked():  # Flip Y-axis if checked
+                y0, y1 = y1, y0
+
+            # Apply X/Y min/max if values are provided
+            if track._x_min_val is not None:
+                x0 = track._x_min_val
+            if track._x_max_val is not None:
+                x1 = track._x_max_val
+            if track._y_min_val is not None:
+                y0 = track._y_min_val
+            if track._y_max_val is not None:
+                y1 = track._y_max_val
+            ax.set_xlim(x0, x1)
+            ax.set_ylim(y0, y1)
+
+        self.canvas.draw_idle()
 
 class CurveControl(QWidget):
     changed = pyqtSignal()
@@ -178,7 +328,8 @@ class CurveControl(QWidget):
         # **Line Style Selection**
         self.line_style_box = QComboBox()
         self.line_style_box.addItems(["Solid", "Dashed", "Dotted", "Dash-dot"])
-        self.line_style_box.currentIndexChanged.connect(self.changed.emit)
+        self._line_style = "-"  # Resolved Matplotlib style, refreshed on selection change
+        self.line_style_box.currentIndexChanged.connect(self._update_line_style)
         layout.addWidget(QPushButton("Line Style:"))
         layout.addWidget(self.line_style_box)
 
@@ -193,10 +344,14 @@ class CurveControl(QWidget):
             self.color = color.name()
             self.changed.emit()
 
+    def _update_line_style(self):
+        styles = {"Solid": "-", "Dashed": "--", "Dotted": ":", "Dash-dot": "-."}
+        self._line_style = styles[self.line_style_box.currentText()]
+        self.changed.emit()
+
     def get_line_style(self):
         """Returns the Matplotlib line style based on selection."""
-        styles = {"Solid": "-", "Dashed": "--", "Dotted": ":", "Dash-dot": "-."}
-        return styles[self.line_style_box.currentText()]
+        return self._line_style
 
 class TrackControl(QWidget):
     changed = pyqtSignal()
@@ -208,6 +363,11 @@ class TrackControl(QWidget):
         self.curves = []
         self.bg_color = "#FFFFFF"  # Default background color (white)
         self.curve_count = 0  # Track number of added curves
+        # Parsed X/Y min/max boxes (None = Auto), updated as the text changes.
+        self._x_min_val = None
+        self._x_max_val = None
+        self._y_min_val = None
+        self._y_max_val = None
         self.setContextMenuPolicy(Qt.CustomContextMenu)
 
         # **Apply StyleSheet to the entire TrackControl Widget**
@@ -258,7 +418,7 @@ class TrackControl(QWidget):
         self.x_min.setStyleSheet("background-color: White; color: blue; font: 12pt;")
         self.x_min.setFixedWidth(50)
         self.x_min.setPlaceholderText("Auto")
-        self.x_min.textChanged.connect(self.changed.emit)  # Connect to changed signal
+        self.x_min.textChanged.connect(lambda text: self._set_limit("_x_min_val", text))
         xy_range_layout.addWidget(self.x_min)
 
         xy_range_layout.addWidget(QLabel("X max:"))
@@ -266,7 +426,7 @@ class TrackControl(QWidget):
         self.x_max.setStyleSheet("background-color: White; color: blue; font: 12pt;")
         self.x_max.setFixedWidth(50)
         self.x_max.setPlaceholderText("Auto")
-        self.x_max.textChanged.connect(self.changed.emit)  # Connect to changed signal
+        self.x_max.textChanged.connect(lambda text: self._set_limit("_x_max_val", text))
         xy_range_layout.addWidget(self.x_max)
 
         xy_range_layout.addWidget(QLabel("Y min:"))
@@ -274,7 +434,7 @@ class TrackControl(QWidget):
         self.y_min.setStyleSheet("background-color: White; color: blue; font: 12pt;")
         self.y_min.setFixedWidth(50)
         self.y_min.setPlaceholderText("Auto")
-        self.y_min.textChanged.connect(self.changed.emit)  # Connect to changed signal
+        self.y_min.textChanged.connect(lambda text: self._set_limit("_y_min_val", text))
         xy_range_layout.addWidget(self.y_min)
 
         xy_range_layout.addWidget(QLabel("Y max:"))
@@ -282,7 +442,7 @@ class TrackControl(QWidget):
         self.y_max.setStyleSheet("background-color: White; color: blue; font: 12pt;")
         self.y_max.setFixedWidth(50)
         self.y_max.setPlaceholderText("Auto")
-        self.y_max.textChanged.connect(self.changed.emit)  # Connect to changed signal
+        self.y_max.textChanged.connect(lambda text: self._set_limit("_y_max_val", text))
         xy_range_layout.addWidget(self.y_max)
 
                 # **Scale Selection**
@@ -311,6 +471,15 @@ class TrackControl(QWidget):
             self.bg_color = color.name()
             self.changed.emit()  # Emit signal to update the plot
 
+    def _set_limit(self, attr, text):
+        """Parse a min/max box once, so replots just read the cached float."""
+        try:
+            value = float(text) if text else None
+        except ValueError:
+            value = None
+        setattr(self, attr, value)
+        self.changed.emit()
+
     def add_curve(self, curves):
         self.curve_count += 1  # Increment curve number
         curve = CurveControl(self.curve_count, curves)  # Pass curve_number
@@ -385,7 +554,23 @@ class WellLogViewer(QMainWindow):
         super().__init__()
         self.wells = {}
         self.tracks = []
-        self.figure_widgets = {}
+        self._all_curves_set = set()  # Union of curve names across loaded wells
+        self._all_curves_sorted = []
+
+        # Coalesce bursts of change signals (e.g. typing in the min/max boxes)
+        # into a single replot.
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.setInterval(80)
+        self._replot_timer.timeout.connect(self._do_update_plot)
+
+        # Folder loads parse on worker threads; a timer collects finished files so
+        # the event loop keeps running while they load.
+        self._load_executor = None
+        self._pending_loads = []  # (path, future) in submission order
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(50)
+        self._load_timer.timeout.connect(self._poll_loads)
         self.initUI()
 
     def initUI(self):
@@ -395,6 +580,11 @@ class WellLogViewer(QMainWindow):
         self.figure_scroll = QScrollArea()
         self.figure_container = QWidget()
         self.figure_layout = QHBoxLayout(self.figure_container)
+        # A single figure holds every selected well, so replots run one
+        # Matplotlib draw regardless of how many wells are shown.
+        self.figure_widget = FigureWidget()
+        self.figure_widget.curve_clicked.connect(self.open_edit_curve_dialog)
+        self.figure_layout.addWidget(self.figure_widget)
         self.figure_scroll.setWidgetResizable(True)
         self.figure_scroll.setWidget(self.figure_container)
         self.setCentralWidget(self.figure_scroll)
@@ -432,8 +622,9 @@ class WellLogViewer(QMainWindow):
         dock_widget = QWidget()
         dock_layout = QVBoxLayout()
 
-        self.well_list = ClickableListWidget()
+        self.well_list = QListWidget()
         self.well_list.itemChanged.connect(self.update_plot)
+        self.well_list.itemClicked.connect(self.toggle_well)  # Whole row toggles the check
         dock_layout.addWidget(QLabel("Loaded Wells:"))
         dock_layout.addWidget(self.well_list)
 
@@ -452,41 +643,52 @@ class WellLogViewer(QMainWindow):
         self.dock.setWidget(dock_widget)
 
     def save_configuration(self):
-        """Save well and track settings to a pickle file."""
+        """Save well and track settings to a JSON file."""
         options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Configuration", "", "Config Files (*.pkl);;All Files (*)", options=options)
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Configuration", "", "Config Files (*.json);;All Files (*)", options=options)
         if file_path:
             config_data = {
                 "selected_wells": [self.well_list.item(i).text() for i in range(self.well_list.count()) if self.well_list.item(i).checkState() == Qt.Checked],
                 "tracks": [{"curves": [curve.curve_box.currentText() for curve in track.curves], "bg_color": track.bg_color} for track in self.tracks]
             }
-            with open(file_path, "wb") as f:  # Use binary write mode
-                pickle.dump(config_data, f)
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(config_data, f, indent=2)
 
     def load_configuration(self):
-        """Load well and track settings from a pickle file."""
+        """Load well and track settings from a JSON file."""
         options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getOpenFileName(self, "Load Configuration", "", "Config Files (*.pkl);;All Files (*)", options=options)
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Configuration", "", "Config Files (*.json);;All Files (*)", options=options)
         if file_path:
-            with open(file_path, "rb") as f:  # Use binary read mode
-                config_data = pickle.load(f)
-
-            # Restore selected wells
-            for i in range(self.well_list.count()):
-                item = self.well_list.item(i)
-                if item.text() in config_data["selected_wells"]:
-                    item.setCheckState(Qt.Checked)
-                else:
-                    item.setCheckState(Qt.Unchecked)
+            with open(file_path, "r", encoding="utf-8") as f:
+                config_data = json.load(f)
+
+            # Restore selected wells; signals are blocked so each setCheckState
+            # doesn't schedule its own replot. One replot follows below.
+            self.well_list.blockSignals(True)
+            try:
+                for i in range(self.well_list.count()):
+                    item = self.well_list.item(i)
+                    if item.text() in config_data["selected_wells"]:
+                        item.setCheckState(Qt.Checked)
+                    else:
+                        item.setCheckState(Qt.Unchecked)
+            finally:
+                self.well_list.blockSignals(False)
 
             # Restore tracks
-            self.tracks.clear()
-            self.track_tabs.clear()
-            for track_data in config_data["tracks"]:
-                track = TrackControl(len(self.tracks) + 1, [])
-                track.bg_color = track_data["bg_color"]
-                self.tracks.append(track)
-                self.track_tabs.addTab(track, f"Track {track.number}")
+            self.track_tabs.blockSignals(True)
+            self.track_tabs.setUpdatesEnabled(False)
+            try:
+                self.tracks.clear()
+                self.track_tabs.clear()
+                for track_data in config_data["tracks"]:
+                    track = TrackControl(len(self.tracks) + 1, [])
+                    track.bg_color = track_data["bg_color"]
+                    self.tracks.append(track)
+                    self.track_tabs.addTab(track, f"Track {track.number}")
+            finally:
+                self.track_tabs.setUpdatesEnabled(True)
+                self.track_tabs.blockSignals(False)
 
             self.update_plot()
 
@@ -502,42 +704,76 @@ class WellLogViewer(QMainWindow):
     def load_las_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder Containing LAS Files")
         if folder:
-            for filename in os.listdir(folder):
-                if filename.lower().endswith(".las"):
-                    self.load_las_file(os.path.join(folder, filename))
+            with os.scandir(folder) as entries:
+                paths = [entry.path for entry in entries
+                         if entry.is_file() and entry.name.lower().endswith(".las")]
+            if not paths:
+                return  # Nothing new to show, so no replot either
+
+            # Parsing runs off the GUI thread so the window stays responsive. lasio
+            # holds the GIL, so this overlaps file reads but does not parse files in
+            # parallel. Qt objects are only touched in _poll_loads, on the GUI thread.
+            if self._load_executor is None:
+                self._load_executor = ThreadPoolExecutor(max_workers=min(8, len(paths)))
+            self._pending_loads.extend((path, self._load_executor.submit(_parse_las, path))
+                                       for path in paths)
+            self._load_timer.start()
+
+    def _poll_loads(self):
+        """Register finished wells, in submission order, and replot once all are in."""
+        # One relayout/paint of the list per batch of finished files, not one per addItem.
+        self.well_list.setUpdatesEnabled(False)
+        try:
+            while self._pending_loads and self._pending_loads[0][1].done():
+                path, future = self._pending_loads.pop(0)
+                try:
+                    well_name, well = future.result()
+                except Exception as e:
+                    print(f"Error loading {path}: {str(e)}")
+                    continue
+                self._register_well(well_name, well)
+        finally:
+            self.well_list.setUpdatesEnabled(True)
+            self.well_list.viewport().update()
+        if not self._pending_loads:
+            self._load_timer.stop()
+            self._load_executor.shutdown(wait=False)
+            self._load_executor = None
             self.update_plot()
 
-    def load_las_file(self, path):
-        try:
-            las = lasio.read(path)
-            df = las.df()
-            df.reset_index(inplace=True)
-            df.dropna(inplace=True)  # Remove rows with NaN values
-            # Find a valid depth column.
-
-            depth_col = next((col for col in df.columns if col.upper() in ["DEPT", "DEPTH", "MD"]), None)
-            if depth_col is None:
-                raise ValueError("No valid depth column found.")
-            df.rename(columns={depth_col: "DEPT"}, inplace=True)
-
-            well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
-            if well_name in self.wells:
-                return
-
-            self.wells[well_name] = {'data': df, 'path': path}
-            item = QListWidgetItem(well_name)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.well_list.addItem(item)
-        except Exception as e:
-            print(f"Error loading {path}: {str(e)}")
+    def _register_well(self, well_name, well):
+        """Add a parsed well to the viewer and the well list."""
+        if well_name in self.wells:
+            return
+        self.wells[well_name] = well
+        new = set(well['names']) - self._all_curves_set
+        if new:
+            self._all_curves_set |= new
+            self._all_curves_sorted = sorted(self._all_curves_set)
+        item = QListWidgetItem(well_name)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Unchecked)
+        self.well_list.addItem(item)
+
+    def toggle_well(self, item):
+        """Let a click on the well's label toggle it, like a click on its check box."""
+        # Qt already toggles clicks on the indicator itself (and Space); flipping
+        # those here too would undo them.
+        view = self.well_list
+        option = QStyleOptionViewItem()
+        option.initFrom(view)
+        option.rect = view.visualItemRect(item)
+        option.features |= QStyleOptionViewItem.HasCheckIndicator
+        indicator = view.style().subElementRect(QStyle.SE_ItemViewItemCheckIndicator, option, view)
+        if indicator.contains(view.viewport().mapFromGlobal(QCursor.pos())):
+            return
+        item.setCheckState(Qt.Unchecked if item.checkState() == Qt.Checked else Qt.Checked)
 
     def add_track(self):
         if not self.wells:
             return
 
-        curves = sorted(set(curve for well in self.wells.values() for curve in well['data'].columns))
-        track = TrackControl(len(self.tracks) + 1, curves)
+        track = TrackControl(len(self.tracks) + 1, self._all_curves_sorted)
         track.changed.connect(self.update_plot)
         track.deleteRequested.connect(self.delete_track)
         self.tracks.append(track)
@@ -554,27 +790,16 @@ class WellLogViewer(QMainWindow):
             self.update_plot()
 
     def update_plot(self):
+        """Schedule a replot; repeated calls within the interval collapse into one."""
+        self._replot_timer.start()
+
+    def _do_update_plot(self):
         selected_wells = [self.well_list.item(i).text() for i in range(self.well_list.count()) if self.well_list.item(i).checkState() == Qt.Checked]
-        for well in selected_wells:
-            if well not in self.figure_widgets:
-                self.figure_widgets[well] = FigureWidget(well)
-                self.figure_layout.addWidget(self.figure_widgets[well])
-                self.figure_widgets[well].curve_clicked.connect(self.open_edit_curve_dialog)
-            self.figure_widgets[well].update_plot(self.wells[well]['data'], self.tracks)
-
-        # Remove figure widgets for deselected wells.
-        for well in list(self.figure_widgets.keys()):
-            if well not in selected_wells:
-                widget = self.figure_widgets[well]
-                self.figure_layout.removeWidget(widget)
-                widget.setParent(None)
-                widget.deleteLater()
-                del self.figure_widgets[well]
+        self.figure_widget.update_plot([(well, self.wells[well]) for well in selected_wells], self.tracks)
 
     def open_edit_curve_dialog(self, curve_name, curve):
         """Open the edit curve dialog for the clicked curve."""
-        available_curves = sorted(set(curve for well in self.wells.values() for curve in well['data'].columns))
-        dialog = EditCurveDialog(curve_name, curve.color, curve.width.value(), curve.get_line_style(), available_curves, self)
+        dialog = EditCurveDialog(curve_name, curve.color, curve.width.value(), curve.get_line_style(), self._all_curves_sorted, self)
         if dialog.exec_():
             curve.curve_box.setCurrentText(dialog.curve_name)
             curve.color = dialog.color
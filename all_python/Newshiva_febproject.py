@@ -1,5 +1,10 @@
 import sys
 import os
+import hashlib
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 import lasio
 import numpy as np
 import pandas as pd
@@ -11,6 +16,120 @@ from PyQt5.QtWidgets import (QMainWindow, QFileDialog, QDockWidget, QListWidget,
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# ----------------------------------------------------------------------
+# Parsed-LAS cache: the depth-normalised DataFrame is stored as Feather
+# (columnar, read back without re-tokenising ASCII) with a JSON sidecar for
+# the well name. Keyed on (format version, abspath, mtime, size), so edited
+# files re-parse; bump CACHE_VERSION when the cached DataFrame layout changes.
+# The directory is this viewer's own, as other viewers cache different layouts.
+# Feather needs pyarrow; without it every load simply goes through lasio.
+# Each write prunes superseded entries of the same file and any entry unused
+# for CACHE_MAX_AGE, so the directory does not grow without bound.
+# ----------------------------------------------------------------------
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".febproject_cache", "newshiva")
+CACHE_VERSION = 1
+CACHE_MAX_AGE = 30 * 24 * 3600
+_CACHE_SUFFIXES = (".feather", ".json")
+
+def _cache_base(path):
+    path = os.path.abspath(path)
+    key = f"v{CACHE_VERSION}|{path}|{os.path.getmtime(path)}|{os.path.getsize(path)}"
+    # Prefixed with a hash of the path alone, so older entries of the same file can be found.
+    source = hashlib.sha1(path.encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{source}_{hashlib.sha1(key.encode()).hexdigest()}")
+
+def _prune_cache(base):
+    name = os.path.basename(base)
+    source = name.split("_", 1)[0] + "_"
+    cutoff = time.time() - CACHE_MAX_AGE
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(name):
+                    continue
+                try:
+                    if entry.name.startswith(source) or entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass  # Already removed by another worker.
+    except OSError:
+        pass
+
+def _load_cached(path):
+    base = _cache_base(path)
+    try:
+        # The sidecar is written last, so its presence marks a complete entry.
+        with open(base + ".json") as f:
+            well_name = json.load(f)["well_name"]
+        df = pd.read_feather(base + ".feather")
+        for suffix in _CACHE_SUFFIXES:
+            os.utime(base + suffix)  # Mark the entry as used for _prune_cache.
+    except (ImportError, OSError, TypeError, ValueError, KeyError):
+        return None
+    return well_name, df
+
+def _save_cached(path, well_name, df):
+    base = _cache_base(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_feather(base + ".feather")
+        with open(base + ".json", "w") as f:
+            json.dump({"well_name": well_name}, f)
+    except (ImportError, OSError, TypeError, ValueError):
+        return  # The cache is only an accelerator.
+    _prune_cache(base)
+
+# ----------------------------------------------------------------------
+# Min/max envelope downsampling: each of target//2 depth buckets keeps its
+# smallest and largest sample (in depth order), so spikes survive while the
+# number of drawn segments stays proportional to the canvas height.
+# ----------------------------------------------------------------------
+def decimate_minmax(column, depth, target):
+    n_bins = target // 2
+    if n_bins < 1 or depth.size <= target:
+        return column, depth
+
+    bucket = depth.size // n_bins
+    n = n_bins * bucket
+    blocks = column[:n].reshape(n_bins, bucket)
+    nan_blocks = np.isnan(blocks)
+    lo = np.where(nan_blocks, np.inf, blocks).argmin(axis=1)
+    hi = np.where(nan_blocks, -np.inf, blocks).argmax(axis=1)
+
+    offsets = np.arange(n_bins) * bucket
+    idx = np.sort(np.stack([lo + offsets, hi + offsets], axis=1), axis=1).ravel()
+    idx = np.concatenate([idx, np.arange(n, depth.size)])
+    return column[idx], depth[idx]
+
+# ----------------------------------------------------------------------
+# Parse one LAS file into (well_name, {column: ndarray}, path), with the
+# depth column named DEPT. Module level and Qt-free so worker processes can run it.
+# ----------------------------------------------------------------------
+def _to_arrays(df):
+    # Plotting only needs 1-D numeric columns: float32 curves (half the bytes of
+    # the float64 DataFrame), while depth keeps float64 for exact depth values.
+    return {col: df[col].to_numpy(dtype=np.float64 if col == "DEPT" else np.float32)
+            for col in df.columns}
+
+def _parse_las(path):
+    cached = _load_cached(path)
+    if cached is not None:
+        well_name, df = cached
+        return well_name, _to_arrays(df), path
+    las = lasio.read(path)
+    df = las.df()
+    df.reset_index(inplace=True)
+    # Identify a valid depth column (DEPT, DEPTH, or MD)
+    depth_col = next((col for col in df.columns if col.upper() in ["DEPT", "DEPTH", "MD"]), None)
+    if depth_col is None:
+        raise ValueError("No valid depth column found.")
+    df.rename(columns={depth_col: "DEPT"}, inplace=True)
+
+    # Use the well name if available; otherwise, use the filename.
+    well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
+    _save_cached(path, well_name, df)
+    return well_name, _to_arrays(df), path
+
 # ----------------------------------------------------------------------
 # WellLogViewer Class: Main window with a QTabWidget as central area.
 # Each selected well gets its own canvas (tab) that plots its tracks.
@@ -21,6 +140,17 @@ class WellLogViewer(QMainWindow):
         self.wells = {}           # Store loaded wells by well name
         self.tracks = []          # List of active track controls
         self.canvas_dict = {}     # Map well name -> {'figure': Figure, 'canvas': FigureCanvas, 'widget': widget}
+        self.dirty_wells = set()  # Wells in background tabs whose plot is out of date
+        # Union of curve names over loaded wells, grown as wells load. Wells are
+        # never unloaded in this UI, so it never needs shrinking.
+        self.curves_union = set()
+        # Folder loads run in a process pool; a timer collects finished files so the
+        # event loop keeps running while they parse.
+        self._load_executor = None
+        self._pending_loads = []  # (path, future) in submission order
+        self._load_timer = QtCore.QTimer(self)
+        self._load_timer.setInterval(50)
+        self._load_timer.timeout.connect(self._poll_loads)
         self.initUI()
        
         
@@ -32,6 +162,8 @@ class WellLogViewer(QMainWindow):
         self.tab_widget = QTabWidget()
         # Set the tab text color so it’s visible.
         self.tab_widget.setStyleSheet("QTabBar::tab { color: white; }")
+        # Only the visible tab is redrawn on changes; others catch up when shown.
+        self.tab_widget.currentChanged.connect(self._flush_dirty)
         self.setCentralWidget(self.tab_widget)
         
         # Create a menubar with a File menu for folder loading.
@@ -78,40 +210,62 @@ class WellLogViewer(QMainWindow):
         # Open a directory chooser.
         folder = QFileDialog.getExistingDirectory(self, "Select Folder Containing LAS Files")
         if folder:
-            # Iterate over files in the folder with .las extension.
-            for filename in os.listdir(folder):
-                if filename.lower().endswith(".las"):
-                    full_path = os.path.join(folder, filename)
-                    self.load_las_file(full_path)
+            # Collect files in the folder with .las extension.
+            paths = [os.path.join(folder, filename) for filename in os.listdir(folder)
+                     if filename.lower().endswith(".las")]
+            if not paths:
+                self.update_plot()
+                return
+            # Files are independent and lasio parsing holds the GIL, so parse
+            # them in worker processes; _poll_loads does the GUI inserts.
+            if self._load_executor is None:
+                # Spawn, not fork: a forked child would inherit Qt's threads' locks mid-use.
+                self._load_executor = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                          mp_context=multiprocessing.get_context("spawn"))
+            self._pending_loads.extend((path, self._load_executor.submit(_parse_las, path))
+                                       for path in paths)
+            self.statusBar().showMessage(f"Loading {len(self._pending_loads)} LAS files...")
+            self._load_timer.start()
+
+    def _poll_loads(self):
+        # Take finished files from the front of the queue only, so wells are listed in
+        # the same order as before whatever order the workers finish in.
+        while self._pending_loads and self._pending_loads[0][1].done():
+            path, future = self._pending_loads.pop(0)
+            try:
+                well_name, arrays, _ = future.result()
+            except Exception as e:
+                self.statusBar().showMessage(f"Error loading {path}: {str(e)}")
+                continue
+            self._add_well(well_name, arrays, path)
+        if not self._pending_loads:
+            self._load_timer.stop()
+            self._load_executor.shutdown(wait=False)
+            self._load_executor = None
             self.update_plot()
     
     def load_las_file(self, path):
         try:
-            las = lasio.read(path)
-            df = las.df()
-            df.reset_index(inplace=True)
-            # Identify a valid depth column (DEPT, DEPTH, or MD)
-            depth_col = next((col for col in df.columns if col.upper() in ["DEPT", "DEPTH", "MD"]), None)
-            if depth_col is None:
-                raise ValueError("No valid depth column found.")
-            df.rename(columns={depth_col: "DEPT"}, inplace=True)
-
-            # Use the well name if available; otherwise, use the filename.
-            well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(path)
-            # Avoid reloading a well with the same name.
-            if well_name in self.wells:
-                return
-            self.wells[well_name] = {'data': df, 'path': path}
-            
-            # Create a checkable list item; unchecked by default.
-            item = QListWidgetItem(well_name)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.well_list.addItem(item)
-            
-            self.statusBar().showMessage(f"Loaded: {well_name}")
+            well_name, arrays, _ = _parse_las(path)
         except Exception as e:
             self.statusBar().showMessage(f"Error loading {path}: {str(e)}")
+            return
+        self._add_well(well_name, arrays, path)
+
+    def _add_well(self, well_name, arrays, path):
+        # Avoid reloading a well with the same name.
+        if well_name in self.wells:
+            return
+        self.wells[well_name] = {'arrays': arrays, 'path': path, '_decimated': {}}
+        self.curves_union.update(arrays)
+
+        # Create a checkable list item; unchecked by default.
+        item = QListWidgetItem(well_name)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Unchecked)
+        self.well_list.addItem(item)
+
+        self.statusBar().showMessage(f"Loaded: {well_name}")
 
     def add_track(self):
         # If no wells are loaded, alert the user.
@@ -119,11 +273,8 @@ class WellLogViewer(QMainWindow):
             self.statusBar().showMessage("No wells loaded!")
             return
 
-        # Create the union of all available curves from loaded wells.
-        curves_set = set()
-        for well in self.wells.values():
-            curves_set.update(well['data'].columns)
-        curves = sorted(list(curves_set))
+        # The union of all available curves from loaded wells.
+        curves = sorted(self.curves_union)
         
         track = TrackControl(len(self.tracks) + 1, curves)
         # Connect the track's signals to update plot.
@@ -161,50 +312,158 @@ class WellLogViewer(QMainWindow):
                 if index != -1:
                     self.tab_widget.removeTab(index)
                 del self.canvas_dict[well]
+                self.dirty_wells.discard(well)
                 
-        # For each selected well, create or update its canvas.
+        # For each selected well, create its canvas if needed; draw only the one
+        # in the visible tab and mark the rest dirty.
         for well in selected_wells:
             if well not in self.canvas_dict:
                 # Create a new Figure and Canvas.
                 fig = Figure()
                 canvas = FigureCanvas(fig)
-                self.canvas_dict[well] = {'figure': fig, 'canvas': canvas, 'widget': canvas}
+                self.canvas_dict[well] = {'figure': fig, 'canvas': canvas, 'widget': canvas,
+                                          'sig': None, 'view': None, 'axes': [], 'lines': [], 'bg': None,
+                                          'target': None}
+                canvas.mpl_connect('draw_event', lambda event, well=well: self._on_canvas_draw(well))
+                canvas.mpl_connect('resize_event', lambda event, well=well: self._on_canvas_resize(well))
                 self.tab_widget.addTab(canvas, well)
-            # Update the plot for this well.
-            data = self.wells[well]['data']
-            fig = self.canvas_dict[well]['figure']
-            fig.clear()
-            n_tracks = len(self.tracks)
-            if n_tracks == 0:
-                ax = fig.add_subplot(111)
-                ax.text(0.5, 0.5, "No track controls", horizontalalignment='center', verticalalignment='center')
-            else:
-                # Create one subplot per track (sharing the y-axis for depth).
-                axes = fig.subplots(1, n_tracks, sharey=True)
-                if n_tracks == 1:
-                    axes = [axes]
-                depth = data['DEPT']
-                for ax, track in zip(axes, self.tracks):
-                    curve = track.curve.currentText()
-                    if curve == "Select Curve":
-                        ax.text(0.5, 0.5, "No curve selected", horizontalalignment='center', verticalalignment='center')
-                        continue
-                    if curve in data.columns:
-                        ax.plot(data[curve], depth,
-                                color=track.color.currentText(),
-                                linewidth=track.width.value(),
-                                linestyle=track.style.currentText())
-                    ax.set_xlabel(curve)
-                    # Set y-axis label "Depth" on the first subplot.
-                    ax.set_ylabel("Depth")
-                    ax.grid(track.grid.isChecked())
-                    if track.flip.isChecked():
-                        ax.invert_xaxis()
-                    ax.set_ylim(depth.max(), depth.min())
-                    ax.legend([well])
-            fig.subplots_adjust(wspace=0.1)
-            self.canvas_dict[well]['canvas'].draw()
+            self.dirty_wells.add(well)
+        self._flush_dirty()
+
+    def _flush_dirty(self, index=None):
+        # Draw the current tab's well if a change arrived while it was hidden.
+        widget = self.tab_widget.currentWidget()
+        for well in list(self.dirty_wells):
+            if self.canvas_dict[well]['widget'] is widget:
+                self.dirty_wells.discard(well)
+                self._draw_well(well)
+                return
+
+    def _draw_well(self, well):
+        # Plot signature: only a change in tracks or curve selection rebuilds the axes.
+        # Grid/flip changes are applied to the existing axes (one redraw), and
+        # color/width/style changes just repaint the lines over the cached background.
+        sig = (len(self.tracks), tuple((id(track), track.curve.currentText()) for track in self.tracks), well)
+        view = tuple((track.grid.isChecked(), track.flip.isChecked()) for track in self.tracks)
+        entry = self.canvas_dict[well]
+        if entry['sig'] == sig:
+            if entry['view'] == view and entry['bg'] is not None:
+                self._blit_lines(well)
+                return
+            entry['view'] = view
+            self._style_lines(entry)
+            self._apply_axes_state(entry)
+            entry['canvas'].draw_idle()
+            return
+        entry['sig'] = sig
+        entry['view'] = view
+        entry['axes'] = []
+        entry['lines'] = []
+        entry['bg'] = None
+        entry['target'] = self._line_target(entry['canvas'])
+        # Update the plot for this well.
+        arrays = self.wells[well]['arrays']
+        fig = entry['figure']
+        fig.clear()
+        n_tracks = len(self.tracks)
+        if n_tracks == 0:
+            ax = fig.add_subplot(111)
+            ax.text(0.5, 0.5, "No track controls", horizontalalignment='center', verticalalignment='center')
+        else:
+            # Create one subplot per track (sharing the y-axis for depth).
+            axes = fig.subplots(1, n_tracks, sharey=True)
+            if n_tracks == 1:
+                axes = [axes]
+            entry['axes'] = list(axes)
+            depth = arrays['DEPT']
+            for ax, track in zip(axes, self.tracks):
+                curve = track.curve.currentText()
+                if curve == "Select Curve":
+                    ax.text(0.5, 0.5, "No curve selected", horizontalalignment='center', verticalalignment='center')
+                    continue
+                if curve in arrays:
+                    # Animated: left out of full draws and painted by _on_canvas_draw/_blit_lines.
+                    line, = ax.plot(*self._line_data(well, curve, entry['target']),
+                                    color=track.color.currentText(),
+                                    linewidth=track.width.value(),
+                                    linestyle=track.style.currentText(),
+                                    animated=True)
+                    entry['lines'].append((line, track))
+                ax.set_xlabel(curve)
+                # Set y-axis label "Depth" on the first subplot.
+                ax.set_ylabel("Depth")
+                ax.grid(track.grid.isChecked())
+                if track.flip.isChecked():
+                    ax.invert_xaxis()
+                ax.set_ylim(np.nanmax(depth), np.nanmin(depth))
+            # One figure-level label: a per-axes legend would bake the line's old style
+            # into the blit background and go stale on color/width/style changes.
+            fig.suptitle(well, fontsize=9, y=0.99)
+        fig.subplots_adjust(wspace=0.1)
+        entry['canvas'].draw()
+
+    @staticmethod
+    def _line_target(canvas):
+        # Two points per pixel row, rounded up to a 256-point bucket so small resizes
+        # reuse the decimated curves instead of recomputing them.
+        return -(-2 * canvas.height() // 256) * 256
+
+    def _on_canvas_resize(self, well):
+        # A canvas is sized only once its tab is shown, and may be resized later; when the
+        # height leaves the bucket the lines were decimated for, rebuild them at the new size.
+        entry = self.canvas_dict.get(well)
+        if entry is None or entry['target'] is None:
+            return
+        if self._line_target(entry['canvas']) != entry['target']:
+            entry['sig'] = None
+            self.dirty_wells.add(well)
+            # Deferred: rebuilding the figure from inside the canvas' resizeEvent is unsafe.
+            QtCore.QTimer.singleShot(0, self._flush_dirty)
+
+    def _line_data(self, well, curve, target):
+        # Downsampled (x, depth) for a curve, cached per well and target size.
+        decimated = self.wells[well]['_decimated']
+        cached = decimated.get(curve)
+        if cached is None or cached[0] != target:
+            arrays = self.wells[well]['arrays']
+            cached = (target,) + decimate_minmax(arrays[curve], arrays['DEPT'], target)
+            decimated[curve] = cached
+        return cached[1], cached[2]
 
+    def _on_canvas_draw(self, well):
+        # A full draw renders everything but the animated lines: keep that as the
+        # background, then paint the lines on top into the same buffer.
+        entry = self.canvas_dict.get(well)
+        if entry is None:
+            return
+        entry['bg'] = entry['canvas'].copy_from_bbox(entry['figure'].bbox)
+        for line, _ in entry['lines']:
+            line.axes.draw_artist(line)
+
+    def _blit_lines(self, well):
+        # Color/width/style changes: restyle the lines and repaint only them.
+        entry = self.canvas_dict[well]
+        canvas = entry['canvas']
+        canvas.restore_region(entry['bg'])
+        self._style_lines(entry)
+        for line, _ in entry['lines']:
+            line.axes.draw_artist(line)
+        canvas.blit(entry['figure'].bbox)
+
+    def _style_lines(self, entry):
+        for line, track in entry['lines']:
+            line.set_color(track.color.currentText())
+            line.set_linewidth(track.width.value())
+            line.set_linestyle(track.style.currentText())
+
+    def _apply_axes_state(self, entry):
+        # Grid and flip in place; the axis' own inverted state stands in for a stored flag.
+        for ax, track in zip(entry['axes'], self.tracks):
+            if track.curve.currentText() == "Select Curve":
+                continue
+            ax.grid(track.grid.isChecked())
+            if ax.xaxis_inverted() != track.flip.isChecked():
+                ax.invert_xaxis()
     
 
 # ----------------------------------------------------------------------
@@ -13,6 +13,10 @@ class WellDataApp(QMainWindow):
         self.setWindowTitle("Well Data Visualization")
         self.setGeometry(100, 100, 800, 400)
 
+        # Names currently in each list, for O(1) duplicate checks
+        self._loaded_names = set()
+        self._selected_names = set()
+
         # Main layout
         self.main_layout = QHBoxLayout()
 
@@ -62,8 +66,9 @@ class WellDataApp(QMainWindow):
                 well_name = las.well.WELL.value if las.well.WELL.value else os.path.basename(file_path)
 
                 # Avoid duplicate wells in the list
-                if well_name not in [self.loaded_list.item(i).text() for i in range(self.loaded_list.count())]:
+                if well_name not in self._loaded_names:
                     self.loaded_list.addItem(well_name)
+                    self._loaded_names.add(well_name)
                 else:
                     QMessageBox.warning(self, "Duplicate Entry", "This well is already loaded.")
             except lasio.exceptions.LASHeaderError:
@@ -76,8 +81,9 @@ class WellDataApp(QMainWindow):
         selected_items = self.loaded_list.selectedItems()
         if selected_items:
             for item in selected_items:
-                if item.text() not in [self.selected_list.item(i).text() for i in range(self.selected_list.count())]:
+                if item.text() not in self._selected_names:
                     self.selected_list.addItem(item.text())
+                    self._selected_names.add(item.text())
                 else:
                     QMessageBox.warning(self, "Duplicate Selection", f"{item.text()} is already selected.")
 
@@ -85,11 +91,13 @@ class WellDataApp(QMainWindow):
         """Removes selected wells from the selected wells list."""
         selected_items = self.selected_list.selectedItems()
         for item in selected_items:
+            self._selected_names.discard(item.text())
             self.selected_list.takeItem(self.selected_list.row(item))
 
     def clear_loaded_wells(self):
         """Clears all wells from the loaded list."""
         self.loaded_list.clear()
+        self._loaded_names.clear()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)